@@ -5,4 +5,4 @@ prototype ipy tools.
 __author__ = 'Travis Harrison'
 __version__ = '0.5'
 __description__ = 'iPython Tools for MG-RAST KBase Matr Qiime'
-__all__ = ["analysis","cdmi","collection","config","expression","flotplot","genopheno","ipyTools","metagenome","networks","ontology","plant","project","qc","retina"]
+__all__ = ["analysis","cdmi","collection","config","expression","flotplot","genopheno","ipyTools","metagenome","networks","ontology","plant","project","qc","retina","stats","transport"]
@@ -1,13 +1,15 @@
 #!/usr/bin/env python
 
-import math, urllib, sys, os, re, hashlib, traceback
+import math, urllib, sys, os, re, hashlib, traceback, threading, cPickle, glob, time
+import numpy as np
 import rpy2.robjects as ro
 from metagenome import Metagenome
+from stats import DIST_METHODS, CLUST_METHODS, distance, dendrogram, principal_coordinates, rarefaction_curve
 from ipyTools import *
 from collections import defaultdict
 from datetime import datetime
 
-def get_analysis_set(ids=[], auth=None, method='WGS', function_source='Subsystems', all_values=False, def_name=None):
+def get_analysis_set(ids=[], auth=None, method='WGS', function_source='Subsystems', all_values=False, def_name=None, workers=None, sparse=False, r_mirrors=True, rollup=False, pushdown=0, store=True):
     """Wrapper for AnalysisSet object creation, checks if cache (created through unique option set) exists first and returns that.
     
     see: help(AnalysisSet)
@@ -15,7 +17,9 @@ def get_analysis_set(ids=[], auth=None, method='WGS', function_source='Subsystem
     if not ids:
         sys.stderr.write("No ids inputted\n")
         return
+    # all options that change the loaded matrices or the plotted values
     cache_id  = "_".join(sorted(ids))+"_"+method+"_"+function_source
+    cache_id += "_values%d_sparse%d_rmirrors%d_rollup%d_pushdown%s"%(bool(all_values), bool(sparse), bool(r_mirrors), bool(rollup), pushdown or 0)
     cache_md5 = hashlib.md5(cache_id).hexdigest()
     cache_obj = load_object(cache_md5)
     if cache_obj is not None:
@@ -27,21 +31,210 @@ def get_analysis_set(ids=[], auth=None, method='WGS', function_source='Subsystem
             (filename,line_number,function_name,text)=traceback.extract_stack()[-2]
             def_name = text[:text.find('=')].strip()
         print "Loading AnalysisSet for selected metagenomes through API.  Please wait, this may take several minutes ... "
-        new_obj = AnalysisSet(ids=ids, auth=auth, method=method, function_source=function_source, all_values=all_values, def_name=def_name)
+        new_obj = AnalysisSet(ids=ids, auth=auth, method=method, function_source=function_source, all_values=all_values, def_name=def_name, workers=workers, sparse=sparse, r_mirrors=r_mirrors, rollup=rollup, pushdown=pushdown, store=store)
         save_object(new_obj, cache_md5)
         print "Done loading through API"
         return new_obj
 
+def get_matrix(ids, annotation=None, level=None, result_type=None, source=None, e_val=None, ident=None, alen=None, filters=[], filter_source=None, auth=None, store=True):
+    """Fetch a matrix through the API, return biom object or None.
+    without filters it is assembled from the per metagenome column store in Ipy.CCH_DIR, only metagenomes not stored yet are fetched.
+    'store' false always fetches the whole matrix"""
+    if not annotation:
+        annotation = Ipy.MATRIX['annotation']
+    if store and (not filters) and Ipy.CCH_DIR:
+        return MatrixStore(annotation, level, result_type, source, e_val, ident, alen, auth=auth).get(ids)
+    return _fetch_matrix(ids, annotation, level, result_type, source, e_val, ident, alen, filters, filter_source, auth)
+
+def _fetch_matrix(ids, annotation, level, result_type, source, e_val, ident, alen, filters, filter_source, auth):
+    params = map(lambda x: ('id', x), ids)
+    params.append(('hide_metadata', '1'))
+    if level:
+        params.append(('group_level', level))
+    if result_type:
+        params.append(('result_type', result_type))
+    if source:
+        params.append(('source', source))
+    if e_val:
+        params.append(('evalue', str(e_val)))
+    if ident:
+        params.append(('identity', str(ident)))
+    if alen:
+        params.append(('length', str(alen)))
+    if len(filters) > 0:
+        params.extend( map(lambda x: ('filter', x), filters) )
+        if filter_source:
+            params.append(('filter_source', filter_source))
+    return obj_from_url( Ipy.API_URL+'matrix/'+annotation+'?'+urllib.urlencode(params, True), auth, arrays=('rows', 'columns', 'data') )
+
+class MatrixStore(object):
+    """Matrix columns of one set of matrix options, one file per metagenome, with a shared row index.
+    a matrix of any metagenome set is built from the stored columns, the missing metagenomes are fetched in one request.
+    metagenomes the api returns no column for are stored as omitted and not fetched again.
+    columns older than Ipy.STORE_TTL seconds are fetched again, the oldest are removed when all stores exceed Ipy.STORE_SIZE bytes.
+    files are in Ipy.CCH_DIR/matrix/<md5 of api url, auth and options>/"""
+    _locks = defaultdict(threading.Lock)
+
+    def __init__(self, annotation, level, result_type, source, e_val, ident, alen, auth=None):
+        self.options = "_".join(map(str, [annotation, level, source, result_type, e_val, ident, alen]))
+        self.params  = (annotation, level, result_type, source, e_val, ident, alen)
+        self.auth    = auth
+        # columns fetched with other auth (private metagenomes) are kept apart
+        self.path    = Ipy.CCH_DIR+'/matrix/'+hashlib.md5(Ipy.API_URL+'_'+(auth or '')+'_'+self.options).hexdigest()
+        self._lock   = MatrixStore._locks[self.path]
+
+    def _col_file(self, mgid):
+        return self.path+'/'+hashlib.md5(mgid).hexdigest()+'.pkl'
+
+    def _load(self, fpath, max_age=None):
+        try:
+            if max_age and (time.time() - os.path.getmtime(fpath) > max_age):
+                return None
+            return cPickle.load(open(fpath, 'rb'))
+        except:
+            return None
+
+    def _save(self, fpath, obj):
+        tmp = fpath+'.'+random_str()
+        cPickle.dump(obj, open(tmp, 'wb'), cPickle.HIGHEST_PROTOCOL)
+        os.rename(tmp, fpath)
+
+    def get(self, ids):
+        """return: biom object of the ids (in order), None if missing ones can not be fetched.
+        ids the api returns no column for are left out, as in the api matrix"""
+        with self._lock:
+            if not os.path.isdir(self.path):
+                os.makedirs(self.path)
+            index = self._load(self.path+'/rows.pkl')
+            cols  = dict([(i, self._load(self._col_file(i), Ipy.STORE_TTL)) for i in ids])
+            missing = [i for i in ids if cols[i] is None]
+            if missing or (index is None):
+                if Ipy.DEBUG:
+                    sys.stdout.write("fetching %d of %d metagenomes for %s\n"%(len(missing), len(ids), self.options))
+                annotation, level, result_type, source, e_val, ident, alen = self.params
+                fetch = missing or ids[:1]
+                biom  = _fetch_matrix(fetch, annotation, level, result_type, source, e_val, ident, alen, [], None, self.auth)
+                if not biom:
+                    return None
+                index = self._add(biom, index, fetch)
+                for i in missing:
+                    cols[i] = self._load(self._col_file(i))
+                self._evict()
+        return self._assemble([i for i in ids if cols[i] and cols[i]['column']], index, cols)
+
+    def _column_ids(self, ids, columns):
+        """return: requested id of each api column, None if not requested.
+        ids are matched as is, then by suffix, the api may return another form of the id (eg. with 'mgm' prefix)"""
+        left  = set(ids) - set(c['id'] for c in columns)
+        found = []
+        for col in columns:
+            if col['id'] in ids:
+                found.append(col['id'])
+                continue
+            match = [i for i in ids if (i in left) and (col['id'].endswith(i) or i.endswith(col['id']))]
+            if match:
+                left.discard(match[0])
+            found.append(match[0] if match else None)
+        return found
+
+    def _add(self, biom, index, ids):
+        """store the columns of biom under the requested ids, ids without column are stored as omitted
+        return: updated row index"""
+        rmax, cmax = len(biom['rows']), len(biom['columns'])
+        row_ids = [r['id'] for r in biom['rows']]
+        values  = [{} for c in range(cmax)]
+        if biom['matrix_type'] == 'dense':
+            matrix = np.array(biom['data']).reshape((rmax, cmax))
+            for r, c in zip(*np.nonzero(matrix)):
+                values[c][row_ids[r]] = matrix[r,c].item()
+        else:
+            for r, c, v in biom['data']:
+                if v:
+                    values[int(c)][row_ids[int(r)]] = v
+        if index is None:
+            index = { 'rows': {},
+                      'info': dict([(k, biom[k]) for k in ('type', 'generated_by', 'format', 'format_url', 'matrix_element_type', 'matrix_element_value') if k in biom]) }
+        for r in biom['rows']:
+            index['rows'].setdefault(r['id'], r)
+        self._save(self.path+'/rows.pkl', index)
+        stored = set()
+        for c, mgid in enumerate(self._column_ids(ids, biom['columns'])):
+            if mgid is not None:
+                self._save(self._col_file(mgid), {'column': biom['columns'][c], 'values': values[c]})
+                stored.add(mgid)
+        for mgid in ids:
+            if mgid not in stored:
+                self._save(self._col_file(mgid), {'column': None, 'values': {}})
+        return index
+
+    def _evict(self):
+        """remove the oldest column files of all stores until they are below 90% of Ipy.STORE_SIZE"""
+        if not Ipy.STORE_SIZE:
+            return
+        files = []
+        for fpath in glob.glob(Ipy.CCH_DIR+'/matrix/*/*.pkl'):
+            if os.path.basename(fpath) == 'rows.pkl':
+                continue
+            try:
+                files.append((os.path.getmtime(fpath), os.path.getsize(fpath), fpath))
+            except OSError:
+                pass
+        total = sum(f[1] for f in files)
+        if total <= Ipy.STORE_SIZE:
+            return
+        for mtime, size, fpath in sorted(files):
+            if total <= 0.9 * Ipy.STORE_SIZE:
+                break
+            try:
+                os.remove(fpath)
+                total -= size
+            except OSError:
+                pass
+
+    def _assemble(self, ids, index, cols):
+        """return: sparse biom object of the stored columns of ids"""
+        row_ids = sorted(set(r for i in ids for r in cols[i]['values']))
+        pos  = dict([(r, n) for n, r in enumerate(row_ids)])
+        data = []
+        for c, i in enumerate(ids):
+            for r, v in cols[i]['values'].iteritems():
+                data.append([pos[r], c, v])
+        data.sort()
+        biom = dict(index['info'])
+        biom['id']    = "_".join(sorted(ids))+"_"+self.options
+        biom['date']  = strftime("%Y-%m-%dT%H:%M:%S", localtime())
+        biom['matrix_type'] = 'sparse'
+        biom['rows']    = [index['rows'][r] for r in row_ids]
+        biom['columns'] = [cols[i]['column'] for i in ids]
+        biom['data']    = data
+        biom['shape']   = [len(row_ids), len(ids)]
+        return biom
+
 class AnalysisSet(object):
     """Class for working with a set of Analysis objects:
         - Creates an Analysis object for each taxonimic level and functional level
         - allows boxplot, barchart, and heatmap navigation through hierarchies (drilldowns)
+        - matrices are fetched concurrently through the API, 'workers' sets the max number of parallel requests (default Ipy.WORKERS, 1 is serial)
+        - matrix columns are stored per metagenome (see MatrixStore), a set overlapping stored metagenomes only fetches the new ones
+        - 'sparse' creates the Analysis objects in sparse mode
+        - 'r_mirrors' false creates the Analysis objects without R matrix objects
+        - 'rollup' fetches only the species and function matrices, the higher taxonomic and ontology levels are summed up locally from the row lineages
+        - 'pushdown' (ratio, 0 is off) loads the level matrices through the api on first use. a drilldown into a level not loaded yet,
+          with children at most ratio of the level names, fetches only their abundance rows (parents as matrix api filter) and keeps them.
+          only for plots with normalize=0 and scale not 'auto', normalized and auto scaled values need the whole level and load it
+        - 'store' false fetches every matrix through the API, without the per metagenome column store
     
     see: help(Analysis)
     """
-    def __init__(self, ids=[], auth=None, method='WGS', function_source='Subsystems', all_values=False, cache=None, def_name=None):
+    def __init__(self, ids=[], auth=None, method='WGS', function_source='Subsystems', all_values=False, cache=None, def_name=None, workers=None, sparse=False, r_mirrors=True, rollup=False, pushdown=0, store=True):
         self.method  = method
+        self.rollup  = rollup
+        self.pushdown = pushdown
+        self.store   = store
+        self._subsets = {}  # (annot, level, parents) -> subset matrix, see _subset()
         self._auth   = auth
+        self.sparse  = sparse
+        self.r_mirrors = r_mirrors
         self.all_mgs = ids
         self.display_mgs = self.all_mgs
         self.function_source = function_source
@@ -64,7 +257,7 @@ class AnalysisSet(object):
             self._get_analysis_set(tax_source=tax_source, all_values=all_values, biom_dir=biom_dir)
         else:
             sys.stdout.write("analysis-set '%s' loading through api\n"%self.defined_name)
-            self._get_analysis_set(tax_source=tax_source, all_values=all_values)
+            self._get_analysis_set(tax_source=tax_source, all_values=all_values, workers=workers)
     
     def set_display_mgs(self, ids=[]):
         if (not ids) or (len(ids) == 0):
@@ -73,27 +266,131 @@ class AnalysisSet(object):
         else:
             self.display_mgs = ids
     
-    def _get_analysis_set(self, tax_source='M5NR', all_values=False, biom_dir=None):
+    def _get_analysis_set(self, tax_source='M5NR', all_values=False, biom_dir=None, workers=None):
+        # groups of levels loaded together: (levels, list of (annotation, level, result_type, source) to load, rollup hierarchy)
+        # with rollup only the leaf level of a hierarchy is loaded, see _rollup_levels()
+        values = Ipy.VALUES if all_values else ['abundance']
+        hierarchies = [('organism', Ipy.TAX_SET, tax_source)]
+        if self.method == 'WGS':
+            hierarchies.append(('function', Ipy.ONT_SET, self.function_source))
+        groups = []
+        for annotation, hierarchy, source in hierarchies:
+            if self.rollup:
+                groups.append(( hierarchy, [(annotation, hierarchy[-1], val, source) for val in values], (hierarchy, annotation, source) ))
+            else:
+                for level in hierarchy:
+                    groups.append(( [level], [(annotation, level, val, source) for val in values], None ))
+        self._biom_dir = biom_dir
+        self._workers  = workers
+        if self.pushdown and (not biom_dir):
+            # loaded on first use, see __getattr__
+            self._lazy = {}
+            for group in groups:
+                for level in group[0]:
+                    self._lazy[level] = group
+            return
+        self._load_levels(groups)
+
+    def __getattr__(self, name):
+        lazy = self.__dict__.get('_lazy')
+        if lazy and (name in lazy):
+            group = lazy[name]
+            for level in group[0]:
+                lazy.pop(level, None)
+            self._load_levels([group])
+            return getattr(self, name)
+        raise AttributeError("'AnalysisSet' object has no attribute '%s'"%name)
+
+    def _load_levels(self, groups):
+        mtypes = []
+        for group in groups:
+            mtypes.extend(group[1])
+        # fetch biom through api in parallel, Analysis objects are built serially as R is not thread safe
+        # failed fetches are retried once through Analysis
+        bioms = [None for x in mtypes]
+        if not self._biom_dir:
+            def fetch(mtype):
+                annotation, level, result_type, source = mtype
+                return get_matrix(self.all_mgs, annotation, level, result_type, source, Ipy.MATRIX['e_val'], Ipy.MATRIX['ident'], Ipy.MATRIX['alen'], auth=self._auth, store=self.store)
+            bioms, errors = pool_map(fetch, mtypes, workers=self._workers, label="matrices loaded")
+            for mtype in mtypes:
+                if mtype in errors:
+                    sys.stderr.write("\nError fetching %s matrix, retrying: %s\n"%("_".join(mtype), errors[mtype]))
         # get data
-        for tax in Ipy.TAX_SET:
-            values = {}
-            if all_values:
-                for val in Ipy.VALUES:
-                    values[val] = self._get_analysis(self.all_mgs, 'organism', tax, val, tax_source, biom_dir)
+        levels = defaultdict(dict)
+        for i, mtype in enumerate(mtypes):
+            annotation, level, result_type, source = mtype
+            levels[level][result_type] = self._get_analysis(self.all_mgs, annotation, level, result_type, source, self._biom_dir, biom=bioms[i])
+        for group in groups:
+            if group[2]:
+                hierarchy, annotation, source = group[2]
+                self._rollup_levels(levels, hierarchy, annotation, source, self._biom_dir)
+        for level, values in levels.iteritems():
+            setattr(self, level, values)
+
+    def _drilldown(self, annot, level, parent, normalize=1, scale='auto'):
+        """return: names of level below the parent names, hash of result_type -> Analysis to plot them from"""
+        children = []
+        if parent and (len(parent) > 0):
+            for p in parent:
+                children.extend( get_hierarchy(htype=annot, level=level, source=self.function_source, parent=p) )
+        if children and (len(children) > 0):
+            children = filter(lambda x: x, children)
+        # normalization and 'auto' scaling use stats of all level rows, the subset has only the children
+        whole = normalize or (isinstance(scale, str) and (scale == 'auto'))
+        to_plot = self._subset(annot, level, parent, children) if (children and not whole) else None
+        if to_plot is None:
+            to_plot = getattr(self, level)
+        return children, to_plot
+
+    def _subset(self, annot, level, parent, children):
+        """abundance Analysis of only the children rows, fetched with the parent names as matrix api filter.
+        only for a level not loaded yet, when the children are at most 'pushdown' of the level names.
+        None if not used, or if the api did not return a subset of the children"""
+        if (not self.pushdown) or (level not in self.__dict__.get('_lazy', {})):
+            return None
+        index = get_hierarchy_index(htype=annot, source=self.function_source)
+        depth = index.level_index(level) if index else None
+        if (depth is None) or (len(children) > self.pushdown * len(index.ranges[depth])):
+            return None
+        key = (annot, level, tuple(sorted(parent)))
+        if key not in self._subsets:
+            annotation, _, _, source = self._lazy[level][1][0]
+            result_type = 'abundance'
+            biom = get_matrix(self.all_mgs, annotation, level, result_type, source, Ipy.MATRIX['e_val'], Ipy.MATRIX['ident'], Ipy.MATRIX['alen'], filters=sorted(parent), filter_source=source, auth=self._auth)
+            names = set(children)
+            if biom and biom['rows'] and all(r['id'] in names for r in biom['rows']):
+                sub_def_name = self.defined_name+'.'+level+"['"+result_type+"']"
+                self._subsets[key] = {result_type: Analysis(biom=biom, auth=self._auth, def_name=sub_def_name, sparse=self.sparse, r_mirrors=self.r_mirrors)}
             else:
-                values['abundance'] = self._get_analysis(self.all_mgs, 'organism', tax, 'abundance', tax_source, biom_dir)
-            setattr(self, tax, values)
-        if self.method == 'WGS':
-            for ont in Ipy.ONT_SET:
-                values = {}
-                if all_values:
-                    for val in Ipy.VALUES:
-                        values[val] = self._get_analysis(self.all_mgs, 'function', ont, val, self.function_source, biom_dir)
+                self._subsets[key] = None
+        return self._subsets[key]
+
+    def _rollup_levels(self, levels, hierarchy, annotation, source, biom_dir):
+        """add the higher levels of hierarchy to levels, rolled up from the Analysis objects of its leaf level.
+        levels that can not be rolled up are loaded as without rollup"""
+        leaf = levels[hierarchy[-1]]
+        abundance = leaf['abundance']._export_biom() if leaf.get('abundance') and leaf['abundance'].biom else None
+        bioms = dict([(k, a._export_biom()) for k, a in leaf.iteritems() if a and a.biom])
+        for level in hierarchy[:-1]:
+            # group index of the level, computed once for all values with the same rows
+            groups = None
+            if abundance and abundance['rows']:
+                hier = 'taxonomy' if annotation == 'organism' else 'ontology'
+                groups = rollup_groups(abundance['rows'], hier, hierarchy.index(level))
+                row_ids = [r['id'] for r in abundance['rows']]
+            for result_type, analysis in leaf.items():
+                sub_def_name = self.defined_name+'.'+level+"['"+result_type+"']"
+                biom = None
+                if result_type in bioms:
+                    same = groups and ([r['id'] for r in bioms[result_type]['rows']] == row_ids)
+                    biom = biom_rollup(bioms[result_type], level, weights=abundance, groups=groups if same else None)
+                if biom:
+                    levels[level][result_type] = Analysis(biom=biom, auth=self._auth, def_name=sub_def_name, sparse=self.sparse, r_mirrors=self.r_mirrors)
                 else:
-                    values['abundance'] = self._get_analysis(self.all_mgs, 'function', ont, 'abundance', self.function_source, biom_dir)
-                setattr(self, ont, values)
+                    levels[level][result_type] = self._get_analysis(self.all_mgs, annotation, level, result_type, source, biom_dir)
 
-    def _get_analysis(self, ids, annotation, level, result_type, source, biom_dir):
+    def _get_analysis(self, ids, annotation, level, result_type, source, biom_dir, biom=None):
         # this needs to be created same way as matrix api builds it
         matrix_id = "_".join(sorted(ids))+"_"+"_".join([annotation, level, source, result_type])
         matrix_id += "_%d_%d_%d"%(Ipy.MATRIX['e_val'], Ipy.MATRIX['ident'], Ipy.MATRIX['alen'])
@@ -106,37 +403,39 @@ class AnalysisSet(object):
             if os.path.isfile(md5_file):
                 if Ipy.DEBUG:
                     sys.stdout.write("loading %s.biom (%s) from dir %s ... \n"%(matrix_md5, matrix_id, biom_dir))
-                return Analysis(bfile=md5_file, auth=self._auth, def_name=sub_def_name)
+                return Analysis(bfile=md5_file, auth=self._auth, def_name=sub_def_name, sparse=self.sparse, r_mirrors=self.r_mirrors)
             elif os.path.isfile(id_file):
                 if Ipy.DEBUG:
                     sys.stdout.write("loading %s.biom from dir %s ... \n"%(matrix_id, biom_dir))
-                return Analysis(bfile=id_file, auth=self._auth, def_name=sub_def_name)
+                return Analysis(bfile=id_file, auth=self._auth, def_name=sub_def_name, sparse=self.sparse, r_mirrors=self.r_mirrors)
             else:
                 sys.stderr.write("no biom file for %s in dir %s\n"%(matrix_id, biom_dir))
                 return None
+        # already fetched through api
+        elif biom:
+            return Analysis(biom=biom, auth=self._auth, def_name=sub_def_name, sparse=self.sparse, r_mirrors=self.r_mirrors)
         # load through api
         else:
             if Ipy.DEBUG:
                 sys.stdout.write("loading %s through api ... \n"%matrix_id)
-            keyArgs = Ipy.MATRIX
+            keyArgs = dict(Ipy.MATRIX)
             keyArgs['ids'] = ids
             keyArgs['annotation'] = annotation
             keyArgs['level'] = level
             keyArgs['result_type'] = result_type
             keyArgs['source'] = source
             keyArgs['def_name'] = sub_def_name
+            keyArgs['sparse'] = self.sparse
+            keyArgs['r_mirrors'] = self.r_mirrors
+            keyArgs['store'] = self.store
             if self._auth:
                 keyArgs['auth'] = self._auth
             return Analysis(**keyArgs)
 
-    def boxplot(self, annot='organism', level='domain', parent=None, width=300, height=300, title="", normalize=1, col_name=True, show_data=False, arg_list=False):
-        children = []
-        if parent and (len(parent) > 0):
-            for p in parent:
-                children.extend( get_hierarchy(htype=annot, level=level, source=self.function_source, parent=p) )
-        if children and (len(children) > 0):
-            children = filter(lambda x: x, children)
+    def boxplot(self, annot='organism', level='domain', parent=None, width=300, height=300, title="", normalize=1, col_name=True, show_data=False, arg_list=False, scale='auto'):
+        children, to_plot = self._drilldown(annot, level, parent, normalize, scale)
         keyArgs = { 'normalize': normalize,
+                    'scale': scale,
                     'width': width,
                     'height': height,
                     'title': title,
@@ -148,17 +447,12 @@ class AnalysisSet(object):
                     'source': 'retina' }
         if Ipy.DEBUG:
             print annot, level, keyArgs
-        to_plot = getattr(self, level)
         return to_plot['abundance'].boxplot(**keyArgs)
     
-    def barchart(self, annot='organism', level='domain', parent=None, width=800, height=0, title="", legend=True, normalize=1, col_name=True, row_full=False, show_data=False, arg_list=False):
-        children = []
-        if parent and (len(parent) > 0):
-            for p in parent:
-                children.extend( get_hierarchy(htype=annot, level=level, source=self.function_source, parent=p) )
-        if children and (len(children) > 0):
-            children = filter(lambda x: x, children)
+    def barchart(self, annot='organism', level='domain', parent=None, width=800, height=0, title="", legend=True, normalize=1, col_name=True, row_full=False, show_data=False, arg_list=False, scale='auto'):
+        children, to_plot = self._drilldown(annot, level, parent, normalize, scale)
         keyArgs = { 'normalize': normalize,
+                    'scale': scale,
                     'width': width,
                     'height': height,
                     'x_rotate': '0',
@@ -176,17 +470,12 @@ class AnalysisSet(object):
             #keyArgs['onclick'] = "'%s.barchart(level=\"%s\", parent=[\"'+params['label']+'\"], annot=\"%s\", normalize=%d, width=%d, height=%d, title=\"%s\", legend=%s, col_name=%s, row_full=%s, show_data=%s)'"%click_opts
         if Ipy.DEBUG:
             print annot, level, next_level, keyArgs
-        to_plot = getattr(self, level)
         return to_plot['abundance'].barchart(**keyArgs)
         
-    def heatmap(self, annot='organism', level='domain', parent=None, width=700, height=600, normalize=1, dist='bray-curtis', clust='ward', col_name=True, row_full=False, show_data=False, arg_list=False):
-        children = []
-        if parent and (len(parent) > 0):
-            for p in parent:
-                children.extend( get_hierarchy(htype=annot, level=level, source=self.function_source, parent=p) )
-        if children and (len(children) > 0):
-            children = filter(lambda x: x, children)
+    def heatmap(self, annot='organism', level='domain', parent=None, width=700, height=600, normalize=1, dist='bray-curtis', clust='ward', col_name=True, row_full=False, show_data=False, arg_list=False, scale='auto'):
+        children, to_plot = self._drilldown(annot, level, parent, normalize, scale)
         keyArgs = { 'normalize': normalize,
+                    'scale': scale,
                     'width': width,
                     'height': height,
                     'dist': dist,
@@ -204,17 +493,12 @@ class AnalysisSet(object):
             #keyArgs['onclick'] = "'%s.heatmap(level=\"%s\", parent=\"'+sel_names+'\", annot=\"%s\", normalize=%d, width=%d, height=%d, dist=\"%s\", clust=\"%s\", col_name=%s, row_full=%s, show_data=%s)'"%click_opts
         if Ipy.DEBUG:
             print annot, level, next_level, keyArgs
-        to_plot = getattr(self, level)
         return to_plot['abundance'].heatmap(**keyArgs)
 
-    def pco(self, annot='organism', level='domain', parent=None, width=700, height=600, title="", normalize=1, dist='bray-curtis', x_axis=1, y_axis=2, col_name=True, show_data=False, arg_list=False):
-        children = []
-        if parent and (len(parent) > 0):
-            for p in parent:
-                children.extend( get_hierarchy(htype=annot, level=level, source=self.function_source, parent=p) )
-        if children and (len(children) > 0):
-            children = filter(lambda x: x, children)
+    def pco(self, annot='organism', level='domain', parent=None, width=700, height=600, title="", normalize=1, dist='bray-curtis', x_axis=1, y_axis=2, col_name=True, show_data=False, arg_list=False, scale='auto'):
+        children, to_plot = self._drilldown(annot, level, parent, normalize, scale)
         keyArgs = { 'normalize': normalize,
+                    'scale': scale,
                     'width': width,
                     'height': height,
                     'title': title,
@@ -233,7 +517,6 @@ class AnalysisSet(object):
             #keyArgs['onclick'] = "'%s.heatmap(level=\"%s\", parent=\"'+sel_names+'\", annot=\"%s\", normalize=%d, width=%d, height=%d, dist=\"%s\", clust=\"%s\", col_name=%s, row_full=%s, show_data=%s)'"%click_opts
         if Ipy.DEBUG:
             print annot, level, next_level, keyArgs
-        to_plot = getattr(self, level)
         return to_plot['abundance'].pco(**keyArgs)
 
     def _bool(self, aBool):
@@ -263,12 +546,16 @@ class Analysis(object):
         self.id       : BIOM id
         self.numIDs   : BIOM column count
         self.numAnnot : BIOM row count
-        self.Dmatrix  : dense matrix of BIOM data
+        self.Dmatrix  : dense matrix of BIOM data (numpy array, scipy csr matrix in sparse mode)
         self.Rmatrix  : R-format dense matrix
-        self.SDmatrix : scaled dense matrix (abundance sum)
+        self.SDmatrix : scaled dense matrix (abundance sum, numpy array, scipy csr matrix in sparse mode)
         self.SRmatrix : R scaled matrix object (abundance sum)
-        self.NDmatrix : normalized dense matrix
+        self.NDmatrix : normalized dense matrix (numpy array)
         self.NRmatrix : normalized R-format dense matrix
+            all matrices are computed on first use and kept
+        self.sparse   : sparse mode (requires scipy), matrices stay sparse and only the rendered slices are made dense,
+                        R matrix objects are not built, biom['data'] is rebuilt from Dmatrix on dump
+        self.r_mirrors: if false R matrix objects are not kept, they are built when needed for plotting (R* matrices are None)
         
         Visualizations:
             self.dump()     : produce file or string of BIOM or tab-deliminated matrix
@@ -277,8 +564,13 @@ class Analysis(object):
             self.pco()      : pco plot of metagenomes
             self.heatmap()  : dendogram of metagenomes / annotations
     """
-    def __init__(self, ids=[], annotation=None, level=None, result_type=None, source=None, e_val=None, ident=None, alen=None, filters=[], filter_source=None, biom=None, bfile=None, auth=None, def_name=None):
+    def __init__(self, ids=[], annotation=None, level=None, result_type=None, source=None, e_val=None, ident=None, alen=None, filters=[], filter_source=None, biom=None, bfile=None, auth=None, def_name=None, sparse=False, r_mirrors=True, store=True):
         self._auth = auth
+        self._store = store
+        self.sparse = sparse and (sp is not None)
+        if sparse and (sp is None):
+            sys.stderr.write("scipy is not available, using dense matrix\n")
+        self.r_mirrors = r_mirrors and (not self.sparse)
         # hack to get variable name
         if def_name == None:
             (filename,line_number,function_name,text)=traceback.extract_stack()[-2]
@@ -305,40 +597,33 @@ class Analysis(object):
         self.result_type = self.biom['matrix_element_value'] if self.biom else ""
         self.numIDs = self.biom['shape'][1] if self.biom else 0
         self.numAnnot = self.biom['shape'][0] if self.biom else 0
-        self.Dmatrix  = self._dense_matrix()  # count dense matrix
-        self.Rmatrix  = pyMatrix_to_rMatrix(self.Dmatrix, self.numAnnot, self.numIDs) # R count matrix object
-        self.SDmatrix = None  # scaled dense matrix (abundance sum)
-        self.SRmatrix = None  # R scaled matrix object (abundance sum)
-        self.NDmatrix = None  # normalized dense matrix
-        self.NRmatrix = None  # R normalized matrix object
-        if self.result_type == 'abundance':
-            self._scale_matrix() # only scale abundance counts
-            self._normalize_matrix() # only normalize abundance counts
-        self.alpha_diversity = None
-        self.rarefaction     = None
+        self._init_index()
+        # matrices are built on first use, see properties
+        self._Dmatrix  = None  # count matrix
+        self._Rmatrix  = None  # R count matrix object
+        self._SDmatrix = None  # scaled dense matrix (abundance sum)
+        self._SRmatrix = None  # R scaled matrix object (abundance sum)
+        self._NDmatrix = None  # normalized dense matrix
+        self._NRmatrix = None  # R normalized matrix object
+        self._norm_params = None  # normalization parameters, see _normalize_params()
+        self._alpha_diversity = None
+        self._rarefaction     = None
+        self._pco_cache       = {}  # (rows, cols, normalize, scale, dist) -> (rows, cols, matrix, eigen values, eigen vectors)
     
+    def _init_index(self):
+        """build id -> index maps for rows and columns, and last hierarchy name -> row indexes"""
+        rows = self.biom['rows'] if self.biom else []
+        cols = self.biom['columns'] if self.biom else []
+        self._row_index  = dict([(r['id'], i) for i, r in enumerate(rows)])
+        self._col_index  = dict([(c['id'], i) for i, c in enumerate(cols)])
+        self._leaf_index = defaultdict(list)
+        if self.hierarchy:
+            for i, r in enumerate(rows):
+                if r['metadata'] and (self.hierarchy in r['metadata']):
+                    self._leaf_index[ r['metadata'][self.hierarchy][-1] ].append(i)
+
     def _get_matrix(self, ids, annotation, level, result_type, source, e_val, ident, alen, filters, filter_source):
-        params = map(lambda x: ('id', x), ids)
-        params.append(('hide_metadata', '1'))
-        if not annotation:
-            annotation = Ipy.MATRIX['annotation']
-        if level:
-            params.append(('group_level', level))
-        if result_type:
-            params.append(('result_type', result_type))
-        if source:
-            params.append(('source', source))
-        if e_val:
-            params.append(('evalue', str(e_val)))
-        if ident:
-            params.append(('identity', str(ident)))
-        if alen:
-            params.append(('length', str(alen)))
-        if len(filters) > 0:
-            params.extend( map(lambda x: ('filter', x), filters) )
-            if filter_source:
-                params.append(('filter_source', filter_source))
-        return obj_from_url( Ipy.API_URL+'matrix/'+annotation+'?'+urllib.urlencode(params, True), self._auth )
+        return get_matrix(ids, annotation, level, result_type, source, e_val, ident, alen, filters, filter_source, auth=self._auth, store=self._store)
 
     def _get_type(self, biom):
         hier = ''
@@ -379,52 +664,47 @@ class Analysis(object):
             cols = all_mgids
         if not rows:
             rows = all_annot
-        matrix = self.Dmatrix
-        # use normalized matrix
-        if normalize and self.NDmatrix:
-            scale  = None
-            matrix = self.NDmatrix
-        # use scaled matrix
-        elif scale and isinstance(scale, str) and (scale == 'auto'):
-            matrix = self.SDmatrix
-        sub_matrix = []
-        sub_rows = []
         sub_cols = []
         # validate rows / get indexes
-        rows = self.force_row_ids(rows)
-        rIndex = []
-        for r in rows:
-            try:
-                rIndex.append( all_annot.index(r) )
-            except (ValueError, AttributeError):
-                pass
+        rIndex = map(lambda r: self._row_index[r], self.force_row_ids(rows))
         # validate cols / get indexes
         cIndex = []
         for c in cols:
-            try:
-                cIndex.append( all_mgids.index(c) )
+            if c in self._col_index:
+                cIndex.append( self._col_index[c] )
                 sub_cols.append(c)
-            except (ValueError, AttributeError):
-                pass
-        # build matrix / remove empty rows
-        for i in rIndex:
-            test = []
-            rdata = []
-            for j in cIndex:
-                test.append(self.Dmatrix[i][j])
-                val = matrix[i][j]
-                # user inputted scaling
-                if scale and isinstance(scale, dict) and (all_mgids[j] in scale):
-                    val = float(val) / scale[all_mgids[j]]
-                # output strings
-                if mark_zero:
-                    val = str(val) + ('*' if self.Dmatrix[i][j] == 0 else '')
-                rdata.append(val)
-            # test if raw row is too small
-            if sum(test) < row_min:
-                continue
-            sub_rows.append(all_annot[i])
-            sub_matrix.append(rdata)
+        rIndex = np.array(rIndex, dtype=int)
+        cIndex = np.array(cIndex, dtype=int)
+        # remove rows where raw sum is too small, only the remaining slice is made dense
+        raw  = take(self.Dmatrix, rIndex, cIndex)
+        keep = np.nonzero(np.asarray(raw.sum(axis=1)).ravel() >= row_min)[0]
+        raw  = to_array(raw[keep])
+        rIndex = rIndex[keep]
+        sub_rows = map(lambda i: all_annot[i], rIndex)
+        # use normalized matrix
+        if normalize and self._has_normalized():
+            scale = None
+            if self.NDmatrix is not None:
+                sub_matrix = take(self.NDmatrix, rIndex, cIndex)
+            else:
+                sub_matrix = normalize_values(raw, self._normalize_params(), cIndex)
+        # use scaled matrix
+        elif scale and isinstance(scale, str) and (scale == 'auto') and (self.SDmatrix is not None):
+            sub_matrix = to_array(take(self.SDmatrix, rIndex, cIndex))
+        else:
+            sub_matrix = raw
+        # user inputted scaling
+        if scale and isinstance(scale, dict):
+            sub_matrix = sub_matrix.astype(object)
+            for j, c in enumerate(sub_cols):
+                if c in scale:
+                    sub_matrix[:,j] = sub_matrix[:,j] / float(scale[c])
+        sub_matrix = sub_matrix.tolist()
+        # output strings
+        if mark_zero:
+            zeros = (raw == 0).tolist()
+            for i, row in enumerate(sub_matrix):
+                sub_matrix[i] = [str(v) + ('*' if zeros[i][j] else '') for j, v in enumerate(row)]
         return sub_rows, sub_cols, sub_matrix
 
     def dump(self, fname=None, fformat='biom', normalize=0, scale='auto', row_min=1, matrix=None, rows=None, cols=None, col_name=True, row_full=True, mark_zero=False):
@@ -450,7 +730,7 @@ class Analysis(object):
             return None
         if fformat == 'biom':
             # biom dump
-            output = json.dumps(self.biom)
+            output = json.dumps(self._export_biom())
         else:
             # get sub parts if not passed matrix, rows, cols:
             # this will validate that rows and cols are in biom and are ids, and that matrix has no all 0 slices
@@ -460,22 +740,7 @@ class Analysis(object):
             if not matrix:
                 sys.stderr.write("No abundance data available for the inputted columns and rows\n")
                 return None
-            # col names if requested
-            if col_name:
-                all_mgids = self.ids()
-                new_cols  = []
-                for c in cols:
-                    i = all_mgids.index(c)
-                    new_cols.append( self.biom['columns'][i]['name'] )
-                cols = new_cols
-            # row path if requested
-            if row_full and self.hierarchy:
-                all_annot = self.annotations()
-                new_rows  = []
-                for r in rows:
-                    i = all_annot.index(r)
-                    new_rows.append( self._get_row_label(self.biom['rows'][i], row_full=row_full) )
-                rows = new_rows
+            rows, cols = self._labels(rows, cols, col_name=col_name, row_full=row_full)
             # print matrix
             output = matrix_to_file(matrix=matrix, cols=cols, rows=rows)
         if fname:
@@ -484,6 +749,17 @@ class Analysis(object):
         else:
             return output
 
+    def _labels(self, rows, cols, col_name=True, row_full=True):
+        """input: row ids, column ids
+        return: row labels (hierarchy path if row_full), column labels (names if col_name)"""
+        # col names if requested
+        if col_name:
+            cols = map(lambda c: self.biom['columns'][ self._col_index[c] ]['name'], cols)
+        # row path if requested
+        if row_full and self.hierarchy:
+            rows = map(lambda r: self._get_row_label(self.biom['rows'][ self._row_index[r] ], row_full=row_full), rows)
+        return rows, cols
+
     def ids(self):
         if not self.biom:
             return []
@@ -508,27 +784,21 @@ class Analysis(object):
         """returns input list with last hierarchal metadata name replaced with id.
         This re-orders input in same order as biom['rows']", and drops those items not in biom['rows']
         """
-        ann = []
-        if not self.hierarchy:
-            # no hierarchy metadata, just return valid ids
-            ann = map( lambda y: y['id'], filter(lambda x: x['id'] in rows, self.biom['rows']) )
-        else:
-            # return only valid ids, input may be id or last heirarchal item
-            for r in self.biom['rows']:
-                if r['id'] in rows:
-                    ann.append(r['id'])
-                elif r['metadata'] and (self.hierarchy in r['metadata']) and (r['metadata'][self.hierarchy][-1] in rows):
-                    ann.append(r['id'])
-        return ann
+        index = set()
+        for r in rows:
+            if r in self._row_index:
+                index.add(self._row_index[r])
+            # input may be last heirarchal item
+            elif r in self._leaf_index:
+                index.update(self._leaf_index[r])
+        return map(lambda i: self.biom['rows'][i]['id'], sorted(index))
 
     def get_id_object(self, aid):
         if not self.biom:
             return None
-        try:
-            items = self.ids()
-            index = items.index(aid)
-        except (ValueError, AttributeError):
-            return None        
+        if aid not in self._col_index:
+            return None
+        index = self._col_index[aid]
         mg = Metagenome(aid, auth=self._auth)
         if mg.name is not None:
             return mg
@@ -538,81 +808,52 @@ class Analysis(object):
     def alpha_diversity(self):
         if self.hierarchy != 'taxonomy':
             return None
-        if self.alpha_diversity is None:
-            alphaDiv = {}
-            for i, aID in enumerate(self.ids()):
-                col = slice_column(self.Dmatrix, i)
-                h1  = 0
-                s1  = sum(col)
-                if not s1:
-                    alphaDiv[aID] = 0
-                    continue
-                for n in col:
-                    p = n/s1
-                    if p > 0:
-                        h1 += (p * math.log(1/p)) / math.log(2)
-                alphaDiv[aID] = 2**h1
-            self.alpha_diversity = alphaDiv
-        return self.alpha_diversity
-
-    def rarefaction(self):
+        if self._alpha_diversity is None:
+            # shannon entropy (base 2) per column over non-zero cells only
+            if self.sparse:
+                cells = self.Dmatrix.tocoo()
+                cIndex, vals = cells.col, cells.data.astype(float)
+            else:
+                rIndex, cIndex = np.nonzero(self.Dmatrix)
+                vals = self.Dmatrix[rIndex, cIndex].astype(float)
+            sums = np.bincount(cIndex, weights=vals, minlength=self.numIDs)
+            p  = vals / sums[cIndex]
+            h1 = np.bincount(cIndex, weights=-p * np.log2(p), minlength=self.numIDs)
+            alpha = np.where(sums > 0, 2**h1, 0)
+            self._alpha_diversity = dict(zip(self.ids(), alpha.tolist()))
+        return self._alpha_diversity
+
+    def rarefaction(self, workers=None):
+        """return: hash of metagenome id -> rarefaction curve (list of [sample size, annotation count]).
+        curves are taken from the metagenome statistics, else computed from the counts (columns run in parallel
+        with 'workers', default Ipy.WORKERS). computed curves match the former per annotation loop within 1e-9 relative.
+        results are kept per metagenome"""
         if self.hierarchy != 'taxonomy':
             return None
-        if self.rarefaction is None:
-            rareFact = defaultdict(list)
-            for i, aID in enumerate(self.ids()):
-                mg = self.get_id_object(aID)
-                if ('rarefaction' in mg.stats) and (len(mg.stats['rarefaction']) > 0):
-                    rareFact[aID] = mg.stats['rarefaction']
-                    continue
-                try:
-                    nseq = int(mg.stats['sequence_count_raw'])
-                    size = int(nseq/1000) if nseq > 1000 else 1
-                except (ValueError, KeyError, TypeError, AttributeError):
-                    rareFact[aID] = []
-                    continue
-                nums = slice_column(self.Dmatrix, i)
-                lnum = len(nums)
-                nums.sort()
-                for i in xrange(0, nseq, size):
-                    coeff = self._nCr2ln(nseq, i)
-                    curr  = 0
-                    for n in nums:
-                        curr += math.exp(self._nCr2ln(nseq-n, i) - coeff)
-                    rareFact[aID].append([i, lnum-curr])
-            self.rarefaction = rareFact
-        return self.rarefaction
-
-    def _nCr2ln(self, n, r):
-        c = 1
-        if r > n:
-            return c
-        if (r < 50) and (n < 50):
-            for x in xrange(0, r-1):
-                c += (c * (n-x)) / (x+1)
-            return math.log(c)
-        if r <= n:
-            c = self._gammaln(n+1) - self._gammaln(r+1) - self._gammaln(n-r)
-        else:
-            c = -1000
-        return c
+        if self._rarefaction is None:
+            self._rarefaction = {}
+        todo = filter(lambda x: x not in self._rarefaction, self.ids())
+        if todo:
+            curves, errors = pool_map(self._rarefaction_curve, todo, workers=workers)
+            for aID, curve in zip(todo, curves):
+                if aID in errors:
+                    sys.stderr.write("Error computing rarefaction for %s: %s\n"%(aID, errors[aID]))
+                else:
+                    self._rarefaction[aID] = curve
+        return self._rarefaction
 
-    def _gammaln(self, x):
-        if x > 0:
-            s = math.log(x)
-            return math.log(2 * math.pi) / 2 + x * s + s / 2 - x
-        else:
-            return 0
+    def _rarefaction_curve(self, aID):
+        mg = self.get_id_object(aID)
+        if ('rarefaction' in mg.stats) and (len(mg.stats['rarefaction']) > 0):
+            return mg.stats['rarefaction']
+        try:
+            nseq = int(mg.stats['sequence_count_raw'])
+        except (ValueError, KeyError, TypeError, AttributeError):
+            return []
+        return rarefaction_curve(slice_column(self.Dmatrix, self._col_index[aID]), nseq)
 
     def boxplot(self, normalize=1, scale='auto', title='', width=300, height=300, cols=None, rows=None, col_name=True, show_data=False, arg_list=False, source='retina'):
-        # default is all
-        if (not cols) or (len(cols) == 0):
-            cols = self.ids()
-        if (not rows) or (len(rows) == 0):
-            rows = self.annotations()
-        # force rows to be row ids
-        else:
-            rows = self.force_row_ids(rows)
+        # default is all, sub_matrix forces rows to be row ids
         rows, cols, matrix = self.sub_matrix(normalize=normalize, scale=scale, cols=cols, rows=rows)
         if not matrix:
             sys.stderr.write("No abundance data available for the inputted columns and rows\n")
@@ -657,31 +898,15 @@ class Analysis(object):
             return fname
 
     def pco(self, normalize=1, scale='auto', title='', dist='bray-curtis', width=700, height=600, x_axis=1, y_axis=2, legend=True, cols=None, rows=None, col_name=True, show_data=False, arg_list=False, source='retina'):
-        # default is all
-        if (not cols) or (len(cols) == 0):
-            cols = self.ids()
-        if (not rows) or (len(rows) == 0):
-            rows = self.annotations()
-        # force rows to be row ids
-        else:
-            rows = self.force_row_ids(rows)
         if source == 'retina':
-            # run our own R code
-            matrix_file = Ipy.TMP_DIR+'/matrix.'+random_str()+'.tab'
-            pco_file = Ipy.TMP_DIR+'/pco.'+random_str()+'.txt'
-            dump_str = self.dump(fformat='tab', normalize=normalize, scale=scale, rows=rows, cols=cols, col_name=col_name, row_full=False)
-            if not dump_str:
+            pco_data = self._pco_data(normalize=normalize, scale=scale, dist=dist, cols=cols, rows=rows)
+            if not pco_data:
+                sys.stderr.write("No abundance data available for the inputted columns and rows\n")
                 return None
-            dump_set = dump_str.strip().split("\n")
-            cols = dump_set[0].strip().split("\t")
-            rows = map(lambda x: x.split("\t")[0], dump_set[1:])
+            rows, cols, matrix, eigen_values, eigen_vectors = pco_data
             if show_data:
-                print dump_str
-            open(matrix_file, 'w').write(dump_str)
-            rcmd = 'source("%s")\nMGRAST_plot_pco(file_in="%s", file_out="%s", dist_method="%s", headers=1)\n'%(Ipy.LIB_DIR+'/plot_pco.r', matrix_file, pco_file, dist)
-            ro.r(rcmd)
-            ## get data from pco_file
-            eigen_values, eigen_vectors = eigen_data_from_file(pco_file)
+                print self.dump(fformat='tab', matrix=matrix, rows=rows, cols=cols, col_name=col_name, row_full=False)
+            rows, cols = self._labels(rows, cols, col_name=col_name, row_full=False)
             if (x_axis < 1) or (y_axis < 1) or (x_axis > len(eigen_values)) or (y_axis > len(eigen_values)):
                 sys.stderr.write("Error: x_axis (%d) and/or y_axis (%d) set beyond principal coordinate range (1 - %d)\n"%(x_axis, y_axis, len(eigen_values)))
             series = []
@@ -691,9 +916,9 @@ class Analysis(object):
             colors = google_palette(len(cols))
             for i, c in enumerate(cols):
                 series.append({'name': c, 'color': colors[i], 'shape': 'circle', 'filled': 1})
-                points.append([{'x': eigen_vectors[c][x_axis-1], 'y': eigen_vectors[c][y_axis-1]}])
-                x_all.append(eigen_vectors[c][x_axis-1])
-                y_all.append(eigen_vectors[c][y_axis-1])
+                points.append([{'x': eigen_vectors[i][x_axis-1], 'y': eigen_vectors[i][y_axis-1]}])
+                x_all.append(eigen_vectors[i][x_axis-1])
+                y_all.append(eigen_vectors[i][y_axis-1])
             x_buffer = math.fabs( (max(x_all) - min(x_all)) * 0.1 )
             y_buffer = math.fabs( (max(y_all) - min(y_all)) * 0.1 )
             data = {'series': series, 'points': points}
@@ -738,6 +963,38 @@ class Analysis(object):
             ro.r("dev.off()")
             return fname
 
+    def _pco_data(self, normalize=1, scale='auto', dist='bray-curtis', cols=None, rows=None):
+        """input: sub_matrix options, distance method
+        return: rows, cols, sub matrix, eigen values, eigen vectors (one per col), or None if no data.
+        cached per options, changing plot axes does not recompute"""
+        if isinstance(scale, dict):
+            scale_key = tuple(sorted(scale.items()))
+        else:
+            scale_key = scale
+        key = (tuple(rows) if rows else None, tuple(cols) if cols else None, normalize, scale_key, dist)
+        if key not in self._pco_cache:
+            rows, cols, matrix = self.sub_matrix(normalize=normalize, scale=scale, cols=cols, rows=rows)
+            if not matrix:
+                return None
+            if dist in DIST_METHODS:
+                # samples are the columns
+                eigen_values, eigen_vectors = principal_coordinates(distance(np.array(matrix, dtype=float).T, dist))
+                eigen_vectors = eigen_vectors.tolist()
+            else:
+                # distance method only available in R
+                eigen_values, eigen_vectors = self._r_pco(matrix, rows, cols, dist)
+            self._pco_cache[key] = (rows, cols, matrix, eigen_values, eigen_vectors)
+        return self._pco_cache[key]
+
+    def _r_pco(self, matrix, rows, cols, dist):
+        matrix_file = Ipy.TMP_DIR+'/matrix.'+random_str()+'.tab'
+        pco_file = Ipy.TMP_DIR+'/pco.'+random_str()+'.txt'
+        matrix_to_file(fname=matrix_file, matrix=matrix, cols=cols, rows=rows)
+        rcmd = 'source("%s")\nMGRAST_plot_pco(file_in="%s", file_out="%s", dist_method="%s", headers=1)\n'%(Ipy.LIB_DIR+'/plot_pco.r', matrix_file, pco_file, dist)
+        ro.r(rcmd)
+        eigen_values, eigen_vectors = eigen_data_from_file(pco_file)
+        return eigen_values, map(lambda c: eigen_vectors[c], cols)
+
     def heatmap(self, normalize=1, scale='auto', title='', dist='bray-curtis', clust='ward', width=700, height=600, cols=None, rows=None, col_name=True, row_full=False, show_data=False, arg_list=False, onclick=None, source='retina'):
         if source == 'retina':
             return self._retina_heatmap(normalize=normalize, scale=scale, dist=dist, clust=clust, width=width, height=height, cols=cols, rows=rows, col_name=col_name, row_full=row_full, show_data=show_data, arg_list=arg_list, onclick=onclick)
@@ -745,39 +1002,26 @@ class Analysis(object):
             return self._matr_heatmap(normalize=normalize, title=title, col_name=col_name)
 
     def _retina_heatmap(self, normalize=1, scale='auto', dist='bray-curtis', clust='ward', width=700, height=600, cols=None, rows=None, col_name=True, row_full=False, show_data=False, arg_list=False, onclick=None):
-        # default is all
-        if (not cols) or (len(cols) == 0):
-            cols = self.ids()
-        if (not rows) or (len(rows) == 0):
-            rows = self.annotations()
-        # force rows to be row ids
-        else:
-            rows = self.force_row_ids(rows)
-        # run our own R code
-        matrix_file = Ipy.TMP_DIR+'/matrix.'+random_str()+'.tab'
-        col_file = Ipy.TMP_DIR+'/col_clust.'+random_str()+'.txt'
-        row_file = Ipy.TMP_DIR+'/row_clust.'+random_str()+'.txt'
-        dump_str = self.dump(fformat='tab', normalize=normalize, scale=scale, rows=rows, cols=cols, col_name=col_name, row_full=row_full)
-        if not dump_str:
+        # default is all, sub_matrix forces rows to be row ids
+        rows, cols, matrix = self.sub_matrix(normalize=normalize, scale=scale, cols=cols, rows=rows)
+        if not matrix:
+            sys.stderr.write("No abundance data available for the inputted columns and rows\n")
             return None
-        dump_set = dump_str.strip().split("\n")
-        cols = dump_set[0].strip().split("\t")
-        rows = map(lambda x: x.split("\t")[0], dump_set[1:])
         if show_data:
-            print dump_str
-        open(matrix_file, 'w').write(dump_str)
-        rcmd = 'source("%s")\nMGRAST_dendrograms(file_in="%s", file_out_column="%s", file_out_row="%s", dist_method="%s", clust_method="%s", produce_figures="FALSE")\n'%(Ipy.LIB_DIR+'/dendrogram.r', matrix_file, col_file, row_file, dist, clust)
-        ro.r(rcmd)
-        cord, cdist = ordered_distance_from_file(col_file)
-        rord, rdist = ordered_distance_from_file(row_file)
-        sub_matrix  = matrix_from_file(matrix_file)
+            print self.dump(fformat='tab', matrix=matrix, rows=rows, cols=cols, col_name=col_name, row_full=row_full)
+        rows, cols = self._labels(rows, cols, col_name=col_name, row_full=row_full)
+        if (dist in DIST_METHODS) and (clust in CLUST_METHODS):
+            cord, cdist, rord, rdist = dendrogram(matrix, dist_method=dist, clust_method=clust)
+        else:
+            # distance method only available in R
+            cord, cdist, rord, rdist = self._r_dendrogram(matrix, rows, cols, dist, clust)
         data = { 'columns': cols,
                  'rows': rows,
                  'colindex': cord,
                  'rowindex': rord,
                  'coldend': cdist,
                  'rowdend': rdist,
-                 'data': sub_matrix }
+                 'data': matrix }
         lwidth  = len(max(rows, key=len)) * 7.2
         keyArgs = { 'data': data,
                     'width': int(width+lwidth),
@@ -797,8 +1041,26 @@ class Analysis(object):
                 sys.stderr.write("Error producing heatmap\n")
             return None
 
+    def _r_dendrogram(self, matrix, rows, cols, dist, clust):
+        matrix_file = Ipy.TMP_DIR+'/matrix.'+random_str()+'.tab'
+        col_file = Ipy.TMP_DIR+'/col_clust.'+random_str()+'.txt'
+        row_file = Ipy.TMP_DIR+'/row_clust.'+random_str()+'.txt'
+        matrix_to_file(fname=matrix_file, matrix=matrix, cols=cols, rows=rows)
+        rcmd = 'source("%s")\nMGRAST_dendrograms(file_in="%s", file_out_column="%s", file_out_row="%s", dist_method="%s", clust_method="%s", produce_figures="FALSE")\n'%(Ipy.LIB_DIR+'/dendrogram.r', matrix_file, col_file, row_file, dist, clust)
+        ro.r(rcmd)
+        cord, cdist = ordered_distance_from_file(col_file)
+        rord, rdist = ordered_distance_from_file(row_file)
+        return cord, cdist, rord, rdist
+
     def _matr_heatmap(self, normalize=1, title='', col_name=True):
-        matrix = self.NRmatrix if normalize and self.NRmatrix else self.Rmatrix
+        if not self.r_mirrors:
+            # no R mirrors kept, build dense R matrix for plotting
+            if normalize and self._has_normalized():
+                matrix = pyMatrix_to_rMatrix(normalize_values(to_array(self.Dmatrix), self._normalize_params()), self.numAnnot, self.numIDs, normalize=1)
+            else:
+                matrix = pyMatrix_to_rMatrix(self.Dmatrix, self.numAnnot, self.numIDs)
+        else:
+            matrix = self.NRmatrix if normalize and self.NRmatrix else self.Rmatrix
         fname  = Ipy.IMG_DIR+'/heatmap_'+random_str()+'.svg'
         labels = self.names() if col_name else self.ids()
         if not matrix:
@@ -838,19 +1100,17 @@ class Analysis(object):
             print self.dump(fformat='tab', matrix=matrix, rows=rows, cols=cols, col_name=col_name, row_full=row_full)
         # set retina data
         for i, c in enumerate(cols):
-            try:
-                j = all_mgids.index(c)
-                name = c if not col_name else self.biom['columns'][j]['name']
-            except:
+            if col_name and (c in self._col_index):
+                name = self.biom['columns'][ self._col_index[c] ]['name']
+            else:
                 name = c
             data.append({'name': name, 'data': slice_column(matrix, i), 'fill': colors[i]})
         # set labels
         if row_full and self.hierarchy:
             for r in rows:
-                try:
-                    i = all_annot.index(r)
-                    labels.append( self._get_row_label(self.biom['rows'][i], row_full=row_full) )
-                except:
+                if r in self._row_index:
+                    labels.append( self._get_row_label(self.biom['rows'][ self._row_index[r] ], row_full=row_full) )
+                else:
                     labels.append(r)
         else:
             labels = rows
@@ -871,7 +1131,7 @@ class Analysis(object):
                     'chartArea': [int(lwidth), 0.02, cwidth, 0.95],
                     'data': data,
                     'onclick': onclick }
-        if normalize and self.NDmatrix:
+        if normalize and self._has_normalized():
             keyArgs['y_labeled_tick_interval'] = 0.1
         if Ipy.DEBUG:
             print cols, rows, keyArgs
@@ -884,44 +1144,87 @@ class Analysis(object):
                 sys.stderr.write("Error producing chart\n")
             return None
 
-    def _scale_matrix(self):
-        try:
-            self.SDmatrix = relative_abundance_matrix(self.Dmatrix)
-            self.SRmatrix = pyMatrix_to_rMatrix(self.SDmatrix, self.numAnnot, self.numIDs)
-        except:
-            sys.stderr.write("Error scaling matrix to adundance sum (%s)\n"%self.id)
+    @property
+    def Dmatrix(self):
+        """count matrix (numpy array, csr matrix in sparse mode)"""
+        if self._Dmatrix is None:
+            self._Dmatrix = self._sparse_matrix() if self.sparse else self._dense_matrix()
+        return self._Dmatrix
 
-    def _normalize_matrix(self):
-        # skip single metagenome matrix
-        if self.numIDs == 1:
-            return
-        try:
-            # can matr do it ?
-            self.NRmatrix = ro.r.normalize(self.Rmatrix)
-            self.NDmatrix = rMatrix_to_pyMatrix(self.NRmatrix, self.numAnnot, self.numIDs)
-        except:
-            try:
-                # run our own R code
-                raw_file = Ipy.TMP_DIR+'/raw.'+random_str()+'.tab'
-                matrix_to_file(fname=raw_file, matrix=self.Dmatrix, cols=self.ids(), rows=self.annotations())
-                norm_file = self._normalize_tabbed(raw_file)
-                self.NDmatrix = matrix_from_file(norm_file, has_col_names=True, has_row_names=True)
-                self.NRmatrix = pyMatrix_to_rMatrix(self.NDmatrix, self.numAnnot, self.numIDs, normalize=1)
-            except:
-                sys.stderr.write("Error normalizing matrix (%s)\n"%self.id)
+    @property
+    def Rmatrix(self):
+        """R count matrix object, None without r_mirrors"""
+        if (self._Rmatrix is None) and self.r_mirrors:
+            self._Rmatrix = pyMatrix_to_rMatrix(self.Dmatrix, self.numAnnot, self.numIDs)
+        return self._Rmatrix
 
-    def _normalize_tabbed(self, rfile):
-        """input: raw tabbed matrix file (with column and row headers)
-        return: normalized tabbed matrix file (with column and row headers)"""
-        nfile = Ipy.TMP_DIR+'/norm.'+random_str()+'.tab'
-        rcmd = 'source("%s")\nMGRAST_preprocessing(file_in="%s", file_out="%s", produce_fig="FALSE")\n'%(Ipy.LIB_DIR+'/preprocessing.r', rfile, nfile)
-        ro.r(rcmd)
-        return nfile
+    @property
+    def SDmatrix(self):
+        """count matrix scaled to abundance sum (numpy array, csr matrix in sparse mode), None if not abundance counts"""
+        # only scale abundance counts
+        if (self._SDmatrix is None) and (self.result_type == 'abundance'):
+            self._SDmatrix = relative_abundance_matrix(self.Dmatrix)
+        return self._SDmatrix
+
+    @property
+    def SRmatrix(self):
+        """R scaled matrix object, None without r_mirrors"""
+        if (self._SRmatrix is None) and self.r_mirrors and (self.SDmatrix is not None):
+            self._SRmatrix = pyMatrix_to_rMatrix(self.SDmatrix, self.numAnnot, self.numIDs, normalize=1)
+        return self._SRmatrix
+
+    @property
+    def NDmatrix(self):
+        """normalized dense matrix (numpy array), None in sparse mode"""
+        if (self._NDmatrix is None) and self._has_normalized() and (not self.sparse):
+            self._NDmatrix = normalize_values(self.Dmatrix, self._normalize_params())
+        return self._NDmatrix
+
+    @property
+    def NRmatrix(self):
+        """R normalized matrix object, None without r_mirrors"""
+        if (self._NRmatrix is None) and self.r_mirrors and (self.NDmatrix is not None):
+            self._NRmatrix = pyMatrix_to_rMatrix(self.NDmatrix, self.numAnnot, self.numIDs, normalize=1)
+        return self._NRmatrix
+
+    def _normalize_params(self):
+        """log transform / standardize parameters of the count matrix, as R/preprocessing.r"""
+        if self._norm_params is None:
+            self._norm_params = normalize_params(self.Dmatrix)
+        return self._norm_params
+
+    def _has_normalized(self):
+        # only normalize abundance counts, skip single metagenome matrix
+        return (self.result_type == 'abundance') and (self.numIDs > 1)
+
+    def _export_biom(self):
+        """return: biom object, data rebuilt from the count matrix in sparse mode"""
+        if (not self.sparse) or ('data' in self.biom):
+            return self.biom
+        cells = self.Dmatrix.tocoo()
+        biom = dict(self.biom)
+        biom['data'] = map(list, zip(cells.row.tolist(), cells.col.tolist(), cells.data.tolist()))
+        return biom
+
+    def _sparse_matrix(self):
+        """return: csr matrix of biom data, biom['data'] is dropped and rebuilt on dump"""
+        if not self.biom:
+            return sp.csr_matrix((0, 0), dtype=int)
+        if self.biom['matrix_type'] == 'dense':
+            matrix = sp.csr_matrix(np.array(self.biom['data']).reshape((self.numAnnot, self.numIDs)))
+        else:
+            data = np.asarray(self.biom['data']).reshape((-1, 3))
+            vals = data[:,2] if len(data) else np.zeros(0, dtype=int)
+            matrix = sp.csr_matrix((vals, (data[:,0].astype(int), data[:,1].astype(int))), shape=(self.numAnnot, self.numIDs))
+        self.biom = dict(self.biom)
+        self.biom['matrix_type'] = 'sparse'
+        del self.biom['data']
+        return matrix
 
     def _dense_matrix(self):
         if not self.biom:
-            return []
+            return np.zeros((0, 0), dtype=int)
         if self.biom['matrix_type'] == 'dense':
-            return self.biom['data']
+            return np.array(self.biom['data']).reshape((self.numAnnot, self.numIDs))
         else:
-            return sparse_to_dense(self.biom['data'], self.numAnnot, self.numIDs)
+            return sparse_to_array(self.biom['data'], self.numAnnot, self.numIDs)
@@ -1,12 +1,12 @@
 #!/usr/bin/env python
 
 import sys, os, hashlib, traceback
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from metagenome import Metagenome
 from ipyTools import *
 from qc import Rarefaction
 
-def get_collection(mgids=[], auth=None, metadata=True, stats=True, def_name=None):
+def get_collection(mgids=[], auth=None, metadata=True, stats=True, def_name=None, workers=None):
     """Wrapper for Collection object creation, checks if cache (created through unique option set) exists first and returns that.
     
     see: help(Collection)
@@ -26,20 +26,23 @@ def get_collection(mgids=[], auth=None, metadata=True, stats=True, def_name=None
             (filename,line_number,function_name,text)=traceback.extract_stack()[-2]
             def_name = text[:text.find('=')].strip()
         print "Loading Collection for selected metagenomes through API. Please wait, this may take several minutes ..."
-        new_obj = Collection(mgids=mgids, auth=auth, metadata=metadata, stats=stats, def_name=def_name)
+        new_obj = Collection(mgids=mgids, auth=auth, metadata=metadata, stats=stats, def_name=def_name, workers=workers)
         save_object(new_obj, cache_md5)
         print "Done loading through API"
         return new_obj
 
 class Collection(object):
     """Class representation of Collection object:
-        metagenomes : [ 'hash', 'key = metagenome_id, value = Metagenome() object']
+        metagenomes : [ 'hash', 'key = metagenome_id, value = Metagenome() object', in inputted order ]
         rarefaction : Rarefaction object for collection metagenomes
-        _mgids : [ 'list', 'inputted metagenome ids' ]
+        failed : [ 'hash', 'key = metagenome_id, value = error for metagenomes that failed to load' ]
+        _mgids : [ 'list', 'inputted metagenome ids that loaded' ]
+
+    metagenomes are fetched concurrently, 'workers' sets the max number of parallel API requests (default Ipy.WORKERS, 1 is serial)
     
     see: help(Metagenome)
     """
-    def __init__(self, mgids=[], metadata=True, stats=True, auth=None, def_name=None, cache=None):
+    def __init__(self, mgids=[], metadata=True, stats=True, auth=None, def_name=None, cache=None, workers=None):
         self._auth  = auth
         self._stats = stats
         # hack to get variable name
@@ -52,12 +55,14 @@ class Collection(object):
         self.defined_name = def_name
         # get metagenomes
         self._mgids = mgids
-        self.metagenomes = self._get_metagenomes(mgids, metadata, stats, cdir=cache)
+        self.failed = {}
+        self.metagenomes = self._get_metagenomes(mgids, metadata, stats, cdir=cache, workers=workers)
+        # ids that failed to load are only in self.failed
+        self._mgids = [mg for mg in mgids if mg in self.metagenomes]
         self.rarefaction = Rarefaction(mgObjs=self.metagenomes.values())
     
-    def _get_metagenomes(self, mgids, metadata, stats, cdir=None):
-        mgs = {}
-        for mg in mgids:
+    def _get_metagenomes(self, mgids, metadata, stats, cdir=None, workers=None):
+        def load(mg):
             keyArgs = { 'metadata': metadata,
                         'stats': stats,
                         'auth': self._auth,
@@ -66,7 +71,22 @@ class Collection(object):
                        }
             if cdir and os.path.isfile(cdir+'/'+mg+'.json'):
                 keyArgs['mfile'] = cdir+'/'+mg+'.json'
-            mgs[mg] = Metagenome(mg, **keyArgs)
+            return Metagenome(mg, **keyArgs)
+        mgs = OrderedDict()
+        mgObjs, errors = pool_map(load, mgids, workers=workers, label="metagenomes loaded" if len(mgids) > 1 else None)
+        for mg, obj in zip(mgids, mgObjs):
+            if mg in errors:
+                self.failed[mg] = errors[mg]
+                continue
+            if obj.name is None:
+                self.failed[mg] = "metagenome not available"
+                continue
+            elif stats and (obj.stats is None):
+                self.failed[mg] = "statistics not available"
+                continue
+            mgs[mg] = obj
+        for mg in self.failed:
+            sys.stderr.write("Error loading metagenome %s: %s\n"%(mg, self.failed[mg]))
         return mgs
     
     def _set_statistics(self):
@@ -88,7 +108,7 @@ class Collection(object):
         if not mgid_set:
             mgid_set = self._mgids
         for m in mgid_set:
-            if m == mgid:
+            if (m == mgid) or (m not in self.metagenomes):
                 continue
             if stat in self.metagenomes[m].stats['sequence_stats']:
                 stat_list.append( toNum(self.metagenomes[m].stats['sequence_stats'][stat]) )
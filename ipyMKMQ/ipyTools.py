@@ -2,11 +2,18 @@
 
 from time import localtime, strftime
 from collections import defaultdict
-import os, sys, urllib, urllib2, json, pickle, copy, glob
+from multiprocessing import TimeoutError
+from multiprocessing.pool import ThreadPool
+import os, sys, urllib, json, pickle, cPickle, copy, glob
 import string, random
+import numpy as np
 import rpy2.robjects as ro
+try:
+    import scipy.sparse as sp
+except ImportError:
+    sp = None
 import retina, flotplot
-import config
+import config, transport
 
 # class for ipy lib env
 class Ipy(object):
@@ -14,6 +21,10 @@ class Ipy(object):
     auth = None
     username = None
     DEBUG   = False
+    WORKERS = 8
+    # matrix column store (see analysis.MatrixStore): max age in seconds, max size in bytes
+    STORE_TTL  = 7 * 24 * 3600
+    STORE_SIZE = 1024 * 1024 * 1024
     FL_PLOT = None
     RETINA  = None
     NB_DIR  = None
@@ -152,7 +163,60 @@ def google_palette(num):
         num_colors.append( Ipy.COLORS[c_index] )
     return num_colors
 
-def obj_from_url(url, auth=None):
+def pool_map(func, items, workers=None, label=None):
+    """input: function taking one item, list of items, max number of worker threads, optional progress label
+    return: list of results in same order as items, and hash of item -> error string for items that raised
+    runs serially when workers < 2 or there is only one item"""
+    if workers is None:
+        workers = Ipy.WORKERS
+    total   = len(items)
+    results = [None for i in range(total)]
+    errors  = {}
+    def run(i):
+        try:
+            return i, func(items[i]), None
+        except Exception, e:
+            return i, None, "%s: %s"%(type(e).__name__, e)
+    pool = None
+    if (workers > 1) and (total > 1):
+        pool = ThreadPool(min(workers, total))
+        done = pool.imap_unordered(run, range(total))
+    else:
+        done = (run(i) for i in range(total))
+    try:
+        for n in range(total):
+            if pool:
+                res = None
+                while res is None:
+                    # wait with a timeout, an untimed wait can not be interrupted (Ctrl-C)
+                    try:
+                        res = done.next(1)
+                    except TimeoutError:
+                        pass
+            else:
+                res = done.next()
+            i, val, err = res
+            if err is None:
+                results[i] = val
+            else:
+                errors[items[i]] = err
+            if label:
+                sys.stdout.write("\r%s: %d of %d done"%(label, n+1, total))
+                sys.stdout.flush()
+    except:
+        if pool:
+            pool.terminate()
+        raise
+    if pool:
+        pool.close()
+        pool.join()
+    if label and total:
+        sys.stdout.write("\n")
+    return results, errors
+
+def obj_from_url(url, auth=None, arrays=()):
+    """input: api url, auth, top level keys of array values to decode element by element (biom 'rows', 'data')
+    return: object decoded from the response stream, None on error"""
     header = {'Accept': 'application/json'}
     if auth:
         header['Auth'] = auth
@@ -161,16 +225,18 @@ def obj_from_url(url, auth=None):
     if Ipy.DEBUG:
         print json.dumps(header)
         print url
+    # pooled keep-alive connection
+    res = transport.urlopen(url, headers=header)
     try:
-        req = urllib2.Request(url, headers=header)
-        res = urllib2.urlopen(req)
-    except urllib2.HTTPError, error:
-        sys.stderr.write("ERROR (%s): %s\n"%(url, error.read()))
-        return None
-    if not res:
-        sys.stderr.write("ERROR (%s): no results returned\n"%url)
-        return None
-    obj = json.loads(res.read())
+        if res.status >= 400:
+            sys.stderr.write("ERROR (%s): %s\n"%(url, res.read()))
+            return None
+        # decode while reading, the raw body is not kept
+        obj = transport.load_json(res, arrays=arrays)
+    except ValueError:
+        obj = None
+    finally:
+        res.close()
     if obj is None:
         sys.stderr.write("ERROR (%s): return structure not valid json format\n"%url)
         return None
@@ -180,6 +246,10 @@ def obj_from_url(url, auth=None):
     return obj
 
 def slice_column(matrix, index):
+    if is_sparse(matrix):
+        return matrix[:, index].toarray().ravel().tolist()
+    if isinstance(matrix, np.ndarray):
+        return matrix[:, index].tolist()
     data = []
     for row in matrix:
         data.append(row[index])
@@ -251,50 +321,101 @@ def eigen_data_from_file(fname):
     return eigen_values, eigen_vectors
 
 def relative_abundance_matrix(matrix):
-    col_sums = []
-    for i in range(len(matrix[0])):
-        col_sums.append( sum(slice_column(matrix, i)) )
-    new_matrix = []
-    for row in matrix:
-        new_row = []
-        for i, c in enumerate(row):
-            new_row.append( float(c) / col_sums[i] )
-        new_matrix.append(new_row)
-    return new_matrix
+    """input: matrix (list of lists, numpy array or scipy sparse matrix)
+    return: numpy array (csr matrix if sparse) of each value divided by its column sum, empty columns stay 0"""
+    if is_sparse(matrix):
+        col_sums = np.asarray(matrix.sum(axis=0), dtype=float).ravel()
+        col_sums[col_sums == 0] = 1
+        matrix = sp.csr_matrix(matrix, dtype=float, copy=True)
+        matrix.data = matrix.data / col_sums[matrix.indices]
+        return matrix
+    matrix = np.asarray(matrix, dtype=float)
+    col_sums = matrix.sum(axis=0)
+    col_sums[col_sums == 0] = 1
+    return matrix / col_sums
+
+def is_sparse(matrix):
+    return (sp is not None) and sp.issparse(matrix)
+
+def to_array(matrix):
+    """return: dense numpy array of matrix"""
+    if is_sparse(matrix):
+        return matrix.toarray()
+    return np.asarray(matrix)
+
+def take(matrix, rIndex, cIndex):
+    """input: numpy array or scipy sparse matrix, list of row indexes, list of column indexes
+    return: sub-matrix of those rows and columns, sparse input stays sparse"""
+    rIndex = np.asarray(rIndex, dtype=int)
+    cIndex = np.asarray(cIndex, dtype=int)
+    if is_sparse(matrix):
+        return matrix.tocsr()[rIndex][:, cIndex]
+    return matrix[np.ix_(rIndex, cIndex)]
+
+def normalize_params(matrix):
+    """input: count matrix (numpy array or scipy sparse matrix)
+    return: column means and stdevs of log2(x+1), global min and max of the standardized values.
+    same transform as R/preprocessing.r (and matR normalize), see normalize_values()"""
+    rmax, cmax = matrix.shape
+    if is_sparse(matrix):
+        logm = sp.csc_matrix(matrix, dtype=float)
+        logm.data = np.log2(logm.data + 1)
+        nnz  = np.diff(logm.indptr)
+        mean = np.asarray(logm.sum(axis=0)).ravel() / rmax
+        # squared deviation of non-zeros, plus the implicit zeros
+        cols = np.repeat(np.arange(cmax), nnz)
+        ssd  = np.bincount(cols, weights=(logm.data - mean[cols])**2, minlength=cmax) + (rmax - nnz) * mean**2
+        lmin = logm.min(axis=0).toarray().ravel()
+        lmax = logm.max(axis=0).toarray().ravel()
+    else:
+        logm = np.log2(np.asarray(matrix, dtype=float) + 1)
+        mean = logm.mean(axis=0)
+        ssd  = ((logm - mean)**2).sum(axis=0)
+        lmin = logm.min(axis=0)
+        lmax = logm.max(axis=0)
+    sd = np.sqrt(ssd / max(rmax - 1, 1))
+    sd[sd == 0] = 1
+    return mean, sd, ((lmin - mean) / sd).min(), ((lmax - mean) / sd).max()
+
+def normalize_values(matrix, params, cIndex=None):
+    """input: dense count matrix (or slice of it), normalize_params() of full matrix, column indexes of slice
+    return: numpy array of log2(x+1), centered per column, scaled 0 to 1 over the full matrix"""
+    mean, sd, zmin, zmax = params
+    if cIndex is not None:
+        mean = mean[cIndex]
+        sd = sd[cIndex]
+    zrange = (zmax - zmin) or 1
+    return (((np.log2(np.asarray(matrix, dtype=float) + 1) - mean) / sd) - zmin) / zrange
+
+def sparse_to_array(sMatrix, rmax, cmax, dtype=None):
+    """input: sparse matrix as list of [row, col, value], row count, column count
+    return: dense numpy array, dtype is taken from the values if not given"""
+    sArray = np.asarray(sMatrix)
+    if dtype is None:
+        dtype = sArray.dtype if len(sArray) else int
+    dMatrix = np.zeros((rmax, cmax), dtype=dtype)
+    if len(sArray):
+        dMatrix[sArray[:,0].astype(int), sArray[:,1].astype(int)] = sArray[:,2]
+    return dMatrix
 
 def sparse_to_dense(sMatrix, rmax, cmax):
-    dMatrix = [[0 for i in range(cmax)] for j in range(rmax)]
-    for sd in sMatrix:
-        r, c, v = sd
-        dMatrix[r][c] = v
-    return dMatrix
+    return sparse_to_array(sMatrix, rmax, cmax).tolist()
 
 def pyMatrix_to_rMatrix(matrix, rmax, cmax, normalize=0):
-    if (not matrix) or (len(matrix) == 0):
+    if (matrix is None) or (rmax * cmax == 0):
         return None
-    mList = []
-    for i in range(cmax):
-        if normalize:
-            cList = map(lambda x: float(x[i]), matrix)
-        else:
-            cList = map(lambda x: int(x[i]), matrix)
-        mList.extend(cList)
+    # R matrix is filled by column
+    mList = to_array(matrix).reshape((rmax, cmax)).flatten('F')
     if normalize:
-        return ro.r.matrix(ro.FloatVector(mList), nrow=rmax)
+        return ro.r.matrix(ro.FloatVector(mList.astype(float).tolist()), nrow=rmax)
     else:
-        return ro.r.matrix(ro.IntVector(mList), nrow=rmax)
+        return ro.r.matrix(ro.IntVector(mList.astype(int).tolist()), nrow=rmax)
 
 def rMatrix_to_pyMatrix(matrix, rmax, cmax):
-    if (not matrix) or (len(matrix) == 0):
+    """return: numpy array from column ordered R matrix"""
+    if (matrix is None) or (len(matrix) == 0):
         return None
-    pyM = [[0 for i in range(cmax)] for j in range(rmax)]
-    col = 0
-    for i in range(len(matrix)):
-        row = i - (rmax * col)
-        pyM[row][col] = matrix[i] 
-        if row == (rmax-1):
-            col += 1
-    return pyM
+    return np.array(list(matrix), dtype=float).reshape((rmax, cmax), order='F')
 
 def random_str(size=8):
     chars = string.ascii_letters + string.digits
@@ -442,46 +563,167 @@ def _merge_dense(data, cols, rows):
 
 def biom_remove_empty(b):
     """imput: biom object
-    return: biom object. cleaned up, all rows with 0's and columns with 0s removed"""
-    vRows = []
-    vCols = []
+    return: biom object. cleaned up, all rows with 0's and columns with 0s removed, sparse stays sparse"""
+    rmax, cmax = len(b['rows']), len(b['columns'])
     if b['matrix_type'] == 'sparse':
-        b['data'] = sparse_to_dense(b['data'], b['shape'][0], b['shape'][1])
-        b['matrix_type'] = 'dense'
-    # get valid rows
-    for i, r in enumerate(b['rows']):
-        row = b['data'][i]
-        if sum(row) > 0:
-            vRows.append(i)
-    # get vaild columns
-    for j, c in enumerate(b['columns']):
-        col = map(lambda x: x[j], b['data'])
-        if sum(col) > 0:
-            vCols.append(j)
-    # clean ['rows'] and ['data'] for rows
-    if len(vRows) < len(b['rows']):
-        sub_rows = []
-        sub_data = []
-        for r in vRows:
-            sub_rows.append(b['rows'][r])
-            sub_data.append(b['data'][r])
-        b['rows'] = sub_rows
-        b['data'] = sub_data
-    # clean ['columns'] and ['data'] for columns
-    if len(vRows) < len(b['columns']):
-        sub_cols = []
-        sub_data = []
-        for c in vCols:
-            sub_cols.append(b['columns'][c])
-        for row in b['data']:
-            sub_row = []
-            for c in vCols:
-                sub_row.append(row[c])
-            sub_data.append(sub_row)
-        b['columns'] = sub_cols
-        b['data'] = sub_data
+        data = np.asarray(b['data']).reshape((-1, 3))
+        rIdx = data[:,0].astype(int)
+        cIdx = data[:,1].astype(int)
+        vRows = np.bincount(rIdx, weights=data[:,2], minlength=rmax) > 0
+        vCols = np.bincount(cIdx, weights=data[:,2], minlength=cmax) > 0
+        # re-index remaining cells
+        rNew = np.cumsum(vRows) - 1
+        cNew = np.cumsum(vCols) - 1
+        keep = vRows[rIdx] & vCols[cIdx] & (data[:,2] != 0)
+        b['data'] = map(list, zip(rNew[rIdx[keep]].tolist(), cNew[cIdx[keep]].tolist(), data[keep,2].tolist()))
+    else:
+        data = np.array(b['data']).reshape((rmax, cmax))
+        vRows = data.sum(axis=1) > 0
+        vCols = data.sum(axis=0) > 0
+        b['data'] = data[np.ix_(vRows, vCols)].tolist()
+    b['rows'] = [r for i, r in enumerate(b['rows']) if vRows[i]]
+    b['columns'] = [c for i, c in enumerate(b['columns']) if vCols[i]]
+    b['shape'] = [len(b['rows']), len(b['columns'])]
     return b
 
+def rollup_groups(rows, hier, depth):
+    """input: biom rows, hierarchy name ('taxonomy' or 'ontology'), index of level in hierarchy
+    return: list of level names (sorted), numpy array of group index of each row.
+    rows without a name at that level are grouped as 'none'"""
+    keys = []
+    for r in rows:
+        lineage = r['metadata'][hier] if r['metadata'] and (hier in r['metadata']) else []
+        name = lineage[depth] if len(lineage) > depth else None
+        keys.append('none' if name is None else name)
+    if not keys:
+        return [], np.zeros(0, dtype=int)
+    names, groups = np.unique(np.array(keys, dtype=object), return_inverse=True)
+    return names.tolist(), groups
+
+def group_sum(matrix, groups, size):
+    """input: numpy array, group index of each row, group count
+    return: numpy array of the row sums of each group"""
+    out = np.zeros((size, matrix.shape[1]), dtype=matrix.dtype)
+    if len(groups):
+        order  = np.argsort(groups, kind='mergesort')
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(groups[order])) + 1))
+        out[groups[order][starts]] = np.add.reduceat(matrix[order], starts, axis=0)
+    return out
+
+def _triplets(b):
+    """input: biom object
+    return: numpy arrays of row index, column index and value of its non-zero cells"""
+    if b['matrix_type'] == 'dense':
+        matrix = np.array(b['data']).reshape((len(b['rows']), len(b['columns'])))
+        rows, cols = np.nonzero(matrix)
+        return rows, cols, matrix[rows, cols]
+    data = np.asarray(b['data'])
+    if not len(data):
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+    return data[:,0].astype(int), data[:,1].astype(int), data[:,2]
+
+def group_cells(rows, cols, values, groups, cmax):
+    """input: sparse cells (numpy arrays of row index, column index, value), group index of each row, column count
+    return: numpy arrays of the summed cells, keys (group * cmax + column, sorted) and float sums"""
+    if not len(rows):
+        return np.zeros(0, dtype=int), np.zeros(0)
+    cells, inverse = np.unique(groups[rows] * cmax + cols, return_inverse=True)
+    return cells, np.bincount(inverse, weights=values.astype(float))
+
+def _rollup_sparse(b, weights, groups, cmax):
+    """biom_rollup of a sparse biom, summed from its cells without a dense matrix
+    return: sparse data list of [group, column, value], None if weights are needed and missing"""
+    rows, cols, values = _triplets(b)
+    if b['matrix_element_value'] == 'abundance':
+        cells, data = group_cells(rows, cols, values, groups, cmax)
+        if values.dtype.kind in 'iu':
+            data = data.round().astype(int)
+    else:
+        if not weights:
+            return None
+        wrows = dict([(r['id'], i) for i, r in enumerate(weights['rows'])])
+        if [r for r in b['rows'] if r['id'] not in wrows]:
+            return None
+        # weight cells moved to the biom rows, cells of other rows are dropped
+        to_row = np.empty(len(weights['rows']), dtype=int)
+        to_row.fill(-1)
+        to_row[[wrows[r['id']] for r in b['rows']]] = np.arange(len(b['rows']))
+        wr, wc, wv = _triplets(weights)
+        wr = to_row[wr]
+        keep = wr >= 0
+        wr, wc, wv = wr[keep], wc[keep], wv[keep].astype(float)
+        tcells, total = group_cells(wr, wc, wv, groups, cmax)
+        # weight of each biom cell, 0 if it has none
+        wkeys = wr * cmax + wc
+        order = np.argsort(wkeys)
+        wkeys, wv = wkeys[order], wv[order]
+        bkeys = rows * cmax + cols
+        pos   = np.searchsorted(wkeys, bkeys)
+        found = pos < len(wkeys)
+        found[found] = wkeys[pos[found]] == bkeys[found]
+        pos = pos[found]
+        cells, data = group_cells(rows[found], cols[found], values[found].astype(float) * wv[pos], groups, cmax)
+        # only cells with weights are summed, so all are in tcells
+        total = total[np.searchsorted(tcells, cells)] if len(cells) else np.zeros(0)
+        data  = np.where(total > 0, data / np.where(total > 0, total, 1), 0)
+    nz = data != 0
+    cells, data = cells[nz], data[nz]
+    return map(list, zip((cells // cmax).tolist(), (cells % cmax).tolist(), data.tolist()))
+
+def biom_rollup(b, level, weights=None, groups=None):
+    """input: biom object of a lower level (eg. species or function), level to roll up to (in Ipy.TAX_SET or Ipy.ONT_SET),
+        abundance biom of the same rows (needed for evalue / identity / length), optional rollup_groups() output to reuse
+    return: biom object of level, abundance is summed over the rows of each level name,
+        other values are abundance weighted means. None if the level is not above the biom rows.
+        a sparse biom is summed from its cells and gives a sparse biom"""
+    if not b:
+        return None
+    if b.get('type', '').startswith('Taxon'):
+        hier, hierarchy = 'taxonomy', Ipy.TAX_SET
+    elif b.get('type', '').startswith('Function'):
+        hier, hierarchy = 'ontology', Ipy.ONT_SET
+    else:
+        return None
+    if level not in hierarchy:
+        return None
+    depth = hierarchy.index(level)
+    rmax, cmax = len(b['rows']), len(b['columns'])
+    names, index = groups if groups else rollup_groups(b['rows'], hier, depth)
+    if b['matrix_type'] != 'dense':
+        data = _rollup_sparse(b, weights, index, cmax)
+        if data is None:
+            return None
+    elif b['matrix_element_value'] == 'abundance':
+        data = group_sum(np.array(b['data']).reshape((rmax, cmax)), index, len(names)).tolist()
+    else:
+        if not weights:
+            return None
+        wrows = dict([(r['id'], i) for i, r in enumerate(weights['rows'])])
+        if [r for r in b['rows'] if r['id'] not in wrows]:
+            return None
+        wmax = len(weights['rows'])
+        matrix  = np.array(b['data']).reshape((rmax, cmax))
+        wmatrix = np.array(weights['data']).reshape((wmax, cmax)) if weights['matrix_type'] == 'dense' else sparse_to_array(weights['data'], wmax, cmax)
+        wmatrix = wmatrix[[wrows[r['id']] for r in b['rows']]].astype(float)
+        total = group_sum(wmatrix, index, len(names))
+        data  = group_sum(matrix * wmatrix, index, len(names))
+        data  = np.where(total > 0, data / np.where(total > 0, total, 1), 0).tolist()
+    # lineage of each level name, from its first row
+    first = {}
+    for i, g in enumerate(index.tolist()):
+        first.setdefault(g, i)
+    rows = []
+    for g, name in enumerate(names):
+        lineage = b['rows'][first[g]]['metadata'][hier][:depth+1] if name != 'none' else [None for x in range(depth+1)]
+        rows.append({'id': name, 'metadata': {hier: lineage}})
+    rBiom = dict(b)
+    rBiom['id']    = b['id']+'_'+level
+    rBiom['date']  = strftime("%Y-%m-%dT%H:%M:%S", localtime())
+    rBiom['rows']  = rows
+    rBiom['data']  = data
+    rBiom['shape'] = [len(rows), cmax]
+    return rBiom
+
 def matrix_remove_empty(m):
     """imput: matrix
     return: matrix. cleaned up, all rows with 0's and columns with 0s removed"""
@@ -501,28 +743,185 @@ def matrix_remove_empty(m):
         vMatrix.append(vRow)
     return vMatrix
 
+class HierarchyIndex(object):
+    """Index of a full m5nr taxonomy or ontology (one source), built from its leaf level lineages, lineages without all levels are left out.
+    lineages are sorted so each node is a few row ranges, children and leaves of a node are taken from its ranges.
+    lookups are kept, a repeated drilldown is a hash lookup"""
+    def __init__(self, htype, source, lineages):
+        self.htype = htype
+        self.source = source
+        self.levels = Ipy.TAX_SET if htype == 'taxonomy' else Ipy.ONT_SET
+        depth = len(self.levels)
+        # one object per name, so the pickle stores each name once
+        names = {}
+        self.lineages = sorted(set(tuple(names.setdefault(n, n) for n in x) for x in lineages if x and (len(x) >= depth)))
+        # level index -> name -> list of [start, end) row ranges
+        self.ranges = [ defaultdict(list) for x in self.levels ]
+        for i in range(depth):
+            prev  = None
+            start = 0
+            for r, branch in enumerate(self.lineages):
+                key = branch[:i+1]
+                if key != prev:
+                    if prev is not None:
+                        self.ranges[i][prev[i]].append((start, r))
+                    prev, start = key, r
+            if prev is not None:
+                self.ranges[i][prev[i]].append((start, len(self.lineages)))
+        self.ranges = [ dict(x) for x in self.ranges ]
+        self._lookups = {}
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['_lookups'] = {}
+        return state
+
+    def level_index(self, level):
+        try:
+            return self.levels.index(level)
+        except (ValueError, AttributeError):
+            return None
+
+    def _rows(self, i, name):
+        for start, end in self.ranges[i].get(name, []):
+            for r in xrange(start, end):
+                yield r
+
+    def children(self, parent, level):
+        """return: names at level below parent (of any higher level)"""
+        key = ('children', parent, level)
+        if key not in self._lookups:
+            j = self.level_index(level)
+            names = []
+            if j is not None:
+                seen = set()
+                for i in range(j):
+                    for r in self._rows(i, parent):
+                        name = self.lineages[r][j]
+                        if name not in seen:
+                            seen.add(name)
+                            names.append(name)
+            self._lookups[key] = names
+        return self._lookups[key]
+
+    def leaves(self, level, name):
+        """return: leaf names below name of level"""
+        key = ('leaves', level, name)
+        if key not in self._lookups:
+            i = self.level_index(level)
+            self._lookups[key] = [] if i is None else _unique([ self.lineages[r][-1] for r in self._rows(i, name) ])
+        return self._lookups[key]
+
+    def branches(self, level):
+        """return: list of distinct lineages down to level"""
+        key = ('branches', level)
+        if key not in self._lookups:
+            i = self.level_index(level)
+            self._lookups[key] = [] if i is None else _unique([ list(x[:i+1]) for x in self.lineages ], key=tuple)
+        return self._lookups[key]
+
+def _unique(items, key=None):
+    """return: list of items without repeats, in order"""
+    seen = set()
+    out  = []
+    for x in items:
+        k = x if key is None else key(x)
+        if k not in seen:
+            seen.add(k)
+            out.append(x)
+    return out
+
+# htype, source -> HierarchyIndex, loaded once per kernel
+_HIERARCHIES = {}
+
+def get_hierarchy_index(htype='taxonomy', source='Subsystems', refresh=False):
+    """return: HierarchyIndex of the full taxonomy or ontology of source, None if it can not be fetched,
+    or if the lineages do not have all levels (eg. ontologies without level3), then lookups go to the api.
+    kept in memory and as a pickle in Ipy.CCH_DIR, 'refresh' fetches it again through the api"""
+    if htype == 'organism':
+        htype = 'taxonomy'
+    if htype == 'function':
+        htype = 'ontology'
+    if htype == 'taxonomy':
+        source = 'M5NR'
+    key = (htype, source)
+    if (key in _HIERARCHIES) and (not refresh):
+        return _HIERARCHIES[key]
+    fpath = Ipy.CCH_DIR+'/hierarchy_'+htype+'_'+source+'.pkl' if Ipy.CCH_DIR else None
+    index = None
+    if fpath and os.path.isfile(fpath) and (not refresh):
+        try:
+            index = cPickle.load(open(fpath, 'rb'))
+            if not index.lineages:
+                index = None
+        except:
+            if Ipy.DEBUG:
+                sys.stderr.write("Error loading hierarchy index from %s\n"%fpath)
+    if index is None:
+        leaf_level = 'species' if htype == 'taxonomy' else 'function'
+        lineages = _fetch_hierarchy(htype, leaf_level, source)
+        if not lineages:
+            return None
+        index = HierarchyIndex(htype, source, lineages)
+        if not index.lineages:
+            # not fetched again in this kernel
+            _HIERARCHIES[key] = None
+            return None
+        if fpath and os.path.isdir(Ipy.CCH_DIR):
+            try:
+                cPickle.dump(index, open(fpath, 'wb'), cPickle.HIGHEST_PROTOCOL)
+            except:
+                sys.stderr.write("Error: unable to save hierarchy index to %s \n"%fpath)
+    _HIERARCHIES[key] = index
+    return index
+
 def get_leaf_nodes(htype='taxonomy', level='domain', source='Subsystems', names=[]):
+    if htype == 'organism':
+        htype = 'taxonomy'
+    if htype == 'function':
+        htype = 'ontology'
+    index = get_hierarchy_index(htype=htype, source=source)
+    if index is None:
+        return _fetch_leaf_nodes(htype, level, source, names)
+    if not names:
+        return _unique([ x[-1] for x in index.lineages ])
+    if index.level_index(level) is None:
+        return []
+    results = []
+    for name in names:
+        results.extend(index.leaves(level, name))
+    return _unique(results)
+
+def _fetch_leaf_nodes(htype, level, source, names):
+    """get_leaf_nodes through the api, for hierarchies without an index"""
     leaf_level = 'species' if htype == 'taxonomy' else 'function'
-    full_hierarchy = get_hierarchy(htype=htype, level=leaf_level, source=source)
+    full_hierarchy = _fetch_hierarchy(htype, leaf_level, source)
     if not names:
-        return slice_column(full_hierarchy, len(full_hierarchy[0])-1)
+        return _unique([ x[-1] for x in full_hierarchy if x ])
     hierarchy = Ipy.TAX_SET if htype == 'taxonomy' else Ipy.ONT_SET
     try:
-        index = hierarchy.index(level)
+        i = hierarchy.index(level)
     except (ValueError, AttributeError):
         return []
-    results = set()
-    for branch in full_hierarchy:
-        if branch[index] in names:
-            results.add(branch[-1])
-    return list(results)
+    names = set(names)
+    return _unique([ x[-1] for x in full_hierarchy if (len(x) > i) and (x[i] in names) ])
 
 def get_hierarchy(htype='taxonomy', level='species', source='Subsystems', parent=None):
-    params = [('min_level', level)]
+    """return: names of level below parent, or lineages down to level without parent. from the hierarchy index"""
     if htype == 'organism':
         htype = 'taxonomy'
     if htype == 'function':
         htype = 'ontology'
+    index = get_hierarchy_index(htype=htype, source=source)
+    if index is None:
+        return _fetch_hierarchy(htype, level, source, parent)
+    if parent is not None:
+        return list(index.children(parent, level))
+    return list(index.branches(level))
+
+def _fetch_hierarchy(htype, level, source, parent=None):
+    params = [('min_level', level)]
+    if htype == 'ontology':
         params.append(('source', source))
     if parent is not None:
         params.append(('parent_name', parent))
@@ -91,7 +91,7 @@ class Metagenome(object):
         return obj_from_url(Ipy.API_URL+'metagenome/'+mgid+'?verbosity='+verb, self._auth)
 
     def _set_statistics(self):
-        self.stats = obj_from_url(Ipy.API_URL+'metagenome_statistics/'+self.id+'?verbosity=full', self._auth)
+        self.stats = obj_from_url(Ipy.API_URL+'metagenome_statistics/'+self.id+'?verbosity=full', self._auth, arrays=('rarefaction',))
     
     def show_metadata(self):
         mdTable = []
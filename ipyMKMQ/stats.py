@@ -0,0 +1,264 @@
+#!/usr/bin/env python
+
+import math
+import numpy as np
+
+# methods with a native implementation, others need the R code in Ipy.LIB_DIR
+DIST_METHODS  = ['bray-curtis', 'euclidean', 'maximum', 'manhattan', 'canberra', 'binary', 'minkowski', 'jaccard', 'sorensen']
+CLUST_METHODS = ['ward', 'ward.D', 'ward.D2', 'single', 'complete', 'average', 'mcquitty', 'median', 'centroid']
+
+def _safe_div(num, den):
+    """0/0 is 0"""
+    out = np.zeros(num.shape)
+    nz  = den != 0
+    out[nz] = num[nz] / den[nz]
+    return out
+
+def _euclidean(x, Y):
+    return np.sqrt(((Y - x)**2).sum(axis=1))
+
+def _maximum(x, Y):
+    return np.abs(Y - x).max(axis=1)
+
+def _manhattan(x, Y):
+    return np.abs(Y - x).sum(axis=1)
+
+def _canberra(x, Y):
+    # as R dist: terms with zero numerator and denominator are dropped and the sum is rescaled
+    num = np.abs(Y - x)
+    den = np.abs(Y + x)
+    used  = den > 0
+    terms = np.where(used, num / np.where(used, den, 1), 0).sum(axis=1)
+    count = used.sum(axis=1)
+    return _safe_div(terms * x.shape[0], count.astype(float))
+
+def _binary(x, Y):
+    # as R dist: share of non-zero features that are non-zero in only one row
+    xb = x != 0
+    Yb = Y != 0
+    return _safe_div((xb ^ Yb).sum(axis=1).astype(float), (xb | Yb).sum(axis=1).astype(float))
+
+def _bray_curtis(x, Y):
+    return _safe_div(np.abs(Y - x).sum(axis=1), (Y + x).sum(axis=1))
+
+def _jaccard(x, Y):
+    # as ecodist: 1 - W / (A + B - W), W is the sum of minimums
+    w = np.minimum(Y, x).sum(axis=1)
+    a = x.sum() + Y.sum(axis=1)
+    return _safe_div(a - 2 * w, a - w)
+
+def _sorensen(x, Y):
+    # as ecodist: bray-curtis on presence / absence
+    return _bray_curtis((x > 0).astype(float), (Y > 0).astype(float))
+
+_DIST = { 'bray-curtis': _bray_curtis,
+          'euclidean': _euclidean,
+          'maximum': _maximum,
+          'manhattan': _manhattan,
+          'canberra': _canberra,
+          'binary': _binary,
+          'minkowski': _euclidean,
+          'jaccard': _jaccard,
+          'sorensen': _sorensen }
+
+def distance(matrix, method='bray-curtis'):
+    """input: matrix (list of lists or numpy array), distance method (one of DIST_METHODS)
+    return: condensed numpy array of distances between the rows of matrix, as R dist only the pairs i < j
+        in row order (0,1), (0,2) .. (1,2) ..., see squareform() for the square matrix"""
+    if method not in _DIST:
+        raise ValueError("unsupported distance method '%s'"%method)
+    X = np.asarray(matrix, dtype=float)
+    n = X.shape[0]
+    dist = np.zeros(n * (n - 1) // 2)
+    start = 0
+    for i in range(n - 1):
+        dist[start:start+n-i-1] = _DIST[method](X[i], X[i+1:])
+        start += n - i - 1
+    return dist
+
+def _condensed_size(dist):
+    """return: item count of a condensed distance array"""
+    return int(round((1 + math.sqrt(1 + 8 * len(dist))) / 2))
+
+def _condensed_index(n, i, ks):
+    """return: positions of the pairs (i, k) for the array of items ks (none equal to i) in a condensed distance array"""
+    lo = np.minimum(i, ks)
+    hi = np.maximum(i, ks)
+    return n * lo - lo * (lo + 1) // 2 + hi - lo - 1
+
+def squareform(dist):
+    """input: condensed distance array (see distance())
+    return: square numpy array of the distances"""
+    dist = np.asarray(dist, dtype=float)
+    n = _condensed_size(dist)
+    D = np.zeros((n, n))
+    D[np.triu_indices(n, 1)] = dist
+    return D + D.T
+
+def _lance_williams(method, dik, djk, dij, ni, nj, nk):
+    """distances from the cluster merged from i and j to all clusters k"""
+    if method == 'single':
+        return np.minimum(dik, djk)
+    elif method == 'complete':
+        return np.maximum(dik, djk)
+    elif method == 'average':
+        return (ni * dik + nj * djk) / (ni + nj)
+    elif method == 'mcquitty':
+        return (dik + djk) / 2
+    elif method == 'median':
+        return (dik + djk) / 2 - dij / 4
+    elif method == 'centroid':
+        return (ni * dik + nj * djk - ni * nj * dij / (ni + nj)) / (ni + nj)
+    else:
+        # ward.D and ward.D2
+        return ((ni + nk) * dik + (nj + nk) * djk - nk * dij) / (ni + nj + nk)
+
+def hclust(dist, method='ward'):
+    """input: condensed distance array (see distance()) or square distance matrix, clustering method (one of CLUST_METHODS, 'ward' is R's 'ward.D')
+    return: merge list of [a, b, height] and leaf order list, in R hclust format:
+        1-based, negative values in merge are single items, positive are earlier merge steps"""
+    if method not in CLUST_METHODS:
+        raise ValueError("unsupported clustering method '%s'"%method)
+    if method == 'ward':
+        method = 'ward.D'
+    # updated in place, only one condensed copy of the distances is kept
+    D = np.array(dist, dtype=float)
+    if D.ndim == 2:
+        D = D[np.triu_indices(D.shape[0], 1)]
+    n = _condensed_size(D)
+    if n < 2:
+        return [], range(1, n+1)
+    if method == 'ward.D2':
+        D **= 2
+    slots  = np.arange(n)
+    size   = np.ones(n)
+    active = np.ones(n, dtype=bool)
+    label  = range(-1, -n-1, -1)
+    # nearest neighbour of each slot among higher slots, as in R's hclust
+    nn     = np.zeros(n, dtype=int)
+    nndist = np.empty(n)
+    nndist.fill(np.inf)
+    def find_nn(i):
+        ks = slots[i+1:][active[i+1:]]
+        if len(ks) > 0:
+            d = D[_condensed_index(n, i, ks)]
+            j = np.argmin(d)
+            nn[i] = ks[j]
+            nndist[i] = d[j]
+        else:
+            nndist[i] = np.inf
+    for i in range(n - 1):
+        find_nn(i)
+    merge = []
+    for step in range(1, n):
+        i2 = np.argmin(nndist)
+        j2 = nn[i2]
+        dij = D[_condensed_index(n, i2, j2)]
+        # new distances for merged cluster, kept in slot i2
+        active[j2] = False
+        active[i2] = False
+        others = slots[active]
+        new = np.empty(n)
+        new.fill(np.inf)
+        if len(others) > 0:
+            ik = _condensed_index(n, i2, others)
+            new[others] = _lance_williams(method, D[ik], D[_condensed_index(n, j2, others)], dij, size[i2], size[j2], size[others])
+            D[ik] = new[others]
+        active[i2] = True
+        nndist[j2] = np.inf
+        size[i2] += size[j2]
+        # R hclust order of merge pairs: singles first, then lower step first
+        a, b = label[i2], label[j2]
+        if (a > 0) and (b < 0):
+            a, b = b, a
+        elif (a > 0) and (b > 0):
+            a, b = min(a, b), max(a, b)
+        height = np.sqrt(dij) if method == 'ward.D2' else dij
+        merge.append([int(a), int(b), float(height)])
+        label[i2] = step
+        # update nearest neighbours
+        for k in np.nonzero(active[:i2] & (new[:i2] < nndist[:i2]))[0]:
+            nn[k] = i2
+            nndist[k] = new[k]
+        for k in np.nonzero(active & ((nn == i2) | (nn == j2)))[0]:
+            find_nn(k)
+        find_nn(i2)
+    # leaf order, expand last merge depth first
+    order = []
+    stack = [n - 1]
+    while stack:
+        x = stack.pop()
+        if x < 0:
+            order.append(-x)
+        else:
+            stack.append(merge[x-1][1])
+            stack.append(merge[x-1][0])
+    return merge, order
+
+def dendrogram(matrix, dist_method='bray-curtis', clust_method='ward'):
+    """input: matrix (rows are annotations, columns are metagenomes), distance method, clustering method
+    return: column order, column merge list, row order, row merge list.
+    same content as the output files of MGRAST_dendrograms in R/dendrogram.r"""
+    X = np.asarray(matrix, dtype=float)
+    row_merge, row_order = hclust(distance(X, dist_method), clust_method)
+    col_merge, col_order = hclust(distance(X.T, dist_method), clust_method)
+    return col_order[::-1], col_merge, row_order, row_merge
+
+def principal_coordinates(dist):
+    """input: condensed distance array (see distance())
+    return: eigen values scaled to sum 1, numpy array of eigen vectors (one row per item, one column per coordinate).
+    principal coordinates as ecodist pco: double-centered -0.5*d^2, negative eigen values set to 0"""
+    D = squareform(dist)
+    A = -0.5 * D**2
+    B = A - A.mean(axis=0) - A.mean(axis=1)[:,np.newaxis] + A.mean()
+    values, vectors = np.linalg.eigh(B)
+    # largest first
+    values  = values[::-1]
+    vectors = vectors[:,::-1]
+    values[values < 0] = 0
+    vectors = vectors * np.sqrt(values)
+    total = values.sum()
+    if total > 0:
+        values = values / total
+    return values.tolist(), vectors
+
+def _gammaln(x):
+    """stirling approximation of log gamma, as used by the MG-RAST rarefaction, 0 for x <= 0"""
+    x = np.asarray(x, dtype=float)
+    s = np.log(np.where(x > 0, x, 1))
+    return np.where(x > 0, np.log(2 * np.pi) / 2 + x * s + s / 2 - x, 0)
+
+def _nCr2ln_small(n, r):
+    c = 1
+    for x in xrange(0, r-1):
+        c += (c * (n-x)) / (x+1)
+    return math.log(c)
+
+def _nCr2ln(n, r):
+    """input: arrays of n and r (broadcast)
+    return: array of log(n choose r) with the MG-RAST approximation"""
+    n, r = np.broadcast_arrays(np.asarray(n, dtype=int), np.asarray(r, dtype=int))
+    c = _gammaln(n+1) - _gammaln(r+1) - _gammaln(n-r)
+    c[r > n] = 1
+    # exact (integer) form for small values
+    for i in zip(*np.nonzero((r < 50) & (n < 50) & (r <= n))):
+        c[i] = _nCr2ln_small(int(n[i]), int(r[i]))
+    return c
+
+def rarefaction_curve(counts, nseq, step=None):
+    """input: annotation counts of one metagenome, sequence count, sample size step (default nseq/1000)
+    return: list of [sample size, expected annotation count].
+    same values as the MG-RAST per annotation loop, all sample sizes of a block are computed in one pass"""
+    counts = np.asarray(counts, dtype=int)
+    # zero counts add 1 to both terms of the difference
+    counts = counts[counts > 0]
+    if step is None:
+        step = int(nseq/1000) if nseq > 1000 else 1
+    sizes = np.arange(0, nseq, step)
+    curve = np.zeros(len(sizes))
+    block = max(1, (2**20) // max(len(counts), 1))
+    for b in xrange(0, len(sizes), block):
+        r = sizes[b:b+block]
+        coeff = _nCr2ln(nseq, r)
+        curve[b:b+block] = len(counts) - np.exp(_nCr2ln(nseq - counts, r[:,np.newaxis]) - coeff[:,np.newaxis]).sum(axis=1)
+    return map(list, zip(sizes.tolist(), curve.tolist()))
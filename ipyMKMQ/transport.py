@@ -0,0 +1,930 @@
+#!/usr/bin/env python
+
+import httplib, urlparse, urllib, urllib2, socket, threading, json, zlib, StringIO
+import os, sys, time, errno, hashlib, tempfile
+from urllib2 import URLError, HTTPError
+from multiprocessing.pool import ThreadPool
+
+# max open connections per host, shared by all threads
+PER_HOST = 8
+MAX_REDIRECT = 5
+# bytes read at a time when decoding a json stream
+CHUNK = 65536
+# max RPC calls running at once over all async clients
+ASYNC_LIMIT = 32
+# defaults of the RPC response cache: one week, 256 MB
+CACHE_TTL  = 7 * 24 * 3600
+CACHE_SIZE = 256 * 1024 * 1024
+
+class PooledResponse(object):
+    """file-like http response, the connection goes back to the pool once the body is read (or on close)"""
+    def __init__(self, pool, key, conn, res, url):
+        self._pool = pool
+        self._key  = key
+        self._conn = conn
+        self._res  = res
+        self.url    = url
+        self.status = res.status
+        self.reason = res.reason
+        self.msg    = res.msg
+
+    def getheader(self, name, default=None):
+        return self._res.getheader(name, default)
+
+    def read(self, amt=None):
+        if self._conn is None:
+            return ''
+        try:
+            data = self._res.read(amt) if amt is not None else self._res.read()
+        except:
+            self._release(False)
+            raise
+        if (amt is None) or (not data) or self._res.isclosed():
+            self._release(self._res.isclosed() and (not self._res.will_close))
+        return data
+
+    def close(self):
+        if self._conn is not None:
+            self._release(self._res.isclosed() and (not self._res.will_close))
+
+    def _release(self, reuse):
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._pool._put(self._key, conn, reuse)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except:
+            pass
+
+class ConnectionPool(object):
+    """keep-alive http / https connections, at most 'per_host' open per (scheme, host, port).
+    requests block while all connections of a host are in use"""
+    def __init__(self, per_host=PER_HOST):
+        self.per_host = per_host
+        self._lock  = threading.Lock()
+        self._idle  = {}
+        self._slots = {}
+
+    def _slot(self, key):
+        with self._lock:
+            if key not in self._slots:
+                self._slots[key] = threading.BoundedSemaphore(self.per_host)
+                self._idle[key]  = []
+            return self._slots[key]
+
+    def _get(self, key, timeout):
+        """return: connection, if it was reused"""
+        self._slot(key).acquire()
+        with self._lock:
+            if self._idle[key]:
+                conn = self._idle[key].pop()
+                conn.timeout = timeout
+                if conn.sock:
+                    conn.sock.settimeout(socket.getdefaulttimeout() if timeout is socket._GLOBAL_DEFAULT_TIMEOUT else timeout)
+                return conn, True
+        scheme, host, port = key
+        if scheme == 'https':
+            return httplib.HTTPSConnection(host, port, timeout=timeout), False
+        return httplib.HTTPConnection(host, port, timeout=timeout), False
+
+    def _put(self, key, conn, reuse):
+        if reuse:
+            with self._lock:
+                self._idle[key].append(conn)
+        else:
+            conn.close()
+        self._slots[key].release()
+
+    def clear(self):
+        """close all idle connections"""
+        with self._lock:
+            for key in self._idle:
+                for conn in self._idle[key]:
+                    conn.close()
+                self._idle[key] = []
+
+    def request(self, url, body=None, headers={}, method=None, timeout=socket._GLOBAL_DEFAULT_TIMEOUT):
+        """input: url, optional body (POST) and headers
+        return: PooledResponse, for any status. redirects are followed"""
+        if method is None:
+            method = 'POST' if body is not None else 'GET'
+        for i in range(MAX_REDIRECT + 1):
+            res = self._request(method, url, body, headers, timeout)
+            location = res.getheader('location')
+            if (res.status in (301, 302, 303, 307, 308)) and location:
+                res.read()
+                url = urlparse.urljoin(url, location)
+                if res.status == 303:
+                    method, body = 'GET', None
+                continue
+            return res
+        return res
+
+    def _request(self, method, url, body, headers, timeout):
+        parts = urlparse.urlsplit(url)
+        port  = parts.port or (443 if parts.scheme == 'https' else 80)
+        key   = (parts.scheme, parts.hostname, port)
+        path  = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        # a reused connection may have been closed by the server, retry once on a new one
+        while True:
+            conn, reused = self._get(key, timeout)
+            try:
+                conn.request(method, path, body, headers)
+                res = conn.getresponse()
+            except:
+                # any error (also KeyboardInterrupt) closes the connection and frees the slot
+                error = sys.exc_info()[1]
+                conn.close()
+                self._slots[key].release()
+                if reused and self._stale(error):
+                    continue
+                raise
+            return PooledResponse(self, key, conn, res, url)
+
+    def _stale(self, error):
+        """return: true if the error shows an idle connection closed by the server, before any response bytes.
+        timeouts are not retried, the request may have reached the server"""
+        if isinstance(error, socket.timeout):
+            return False
+        if isinstance(error, httplib.BadStatusLine):
+            return True
+        return isinstance(error, socket.error) and (error.errno in (errno.ECONNRESET, errno.EPIPE, errno.ECONNABORTED))
+
+class ProxyResponse(object):
+    """urllib2 response (or HTTPError) with the PooledResponse interface"""
+    def __init__(self, res):
+        self._res   = res
+        self.url    = res.geturl()
+        self.status = res.getcode()
+        self.reason = getattr(res, 'msg', '')
+        self.msg    = res.info()
+
+    def getheader(self, name, default=None):
+        return self.msg.getheader(name, default)
+
+    def read(self, amt=None):
+        return self._res.read(amt) if amt is not None else self._res.read()
+
+    def close(self):
+        self._res.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class DecodedResponse(object):
+    """response with the body decompressed while it is read (gzip / deflate content-encoding)"""
+    def __init__(self, res):
+        self._res   = res
+        self.url    = res.url
+        self.status = res.status
+        self.code   = res.status
+        self.reason = res.reason
+        self.msg    = res.msg
+        self.headers = res.msg
+        self._buf  = ''
+        self._done = False
+        self._raw_deflate = False
+        encoding = (res.getheader('content-encoding') or '').strip().lower()
+        if encoding in ('gzip', 'x-gzip'):
+            self._zlib = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == 'deflate':
+            # zlib wrapped, some servers send raw deflate
+            self._zlib = zlib.decompressobj()
+            self._raw_deflate = True
+        else:
+            self._zlib = None
+
+    def getheader(self, name, default=None):
+        return self._res.getheader(name, default)
+
+    def info(self):
+        return self.msg
+
+    def _fill(self):
+        data = self._res.read(CHUNK)
+        _count(len(data), 0)
+        if not data:
+            self._done = True
+            if self._zlib:
+                self._buf += self._zlib.flush()
+        elif self._zlib:
+            try:
+                self._buf += self._zlib.decompress(data)
+            except zlib.error:
+                if not self._raw_deflate:
+                    raise
+                self._zlib = zlib.decompressobj(-zlib.MAX_WBITS)
+                self._buf += self._zlib.decompress(data)
+            self._raw_deflate = False
+        else:
+            self._buf += data
+
+    def read(self, amt=None):
+        while (not self._done) and ((amt is None) or (len(self._buf) < amt)):
+            self._fill()
+        if amt is None:
+            data, self._buf = self._buf, ''
+        else:
+            data, self._buf = self._buf[:amt], self._buf[amt:]
+        _count(0, len(data))
+        return data
+
+    def close(self):
+        self._res.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+POOL = ConnectionPool()
+
+# bytes received on the wire and bytes after decompression, all responses read through urlopen
+_STATS = {'wire': 0, 'decoded': 0}
+_STATS_LOCK = threading.Lock()
+
+def _count(wire, decoded):
+    with _STATS_LOCK:
+        _STATS['wire'] += wire
+        _STATS['decoded'] += decoded
+
+def transfer_stats():
+    """return: hash of bytes read on the wire and decoded (response bodies), and their ratio"""
+    with _STATS_LOCK:
+        stats = dict(_STATS)
+    stats['ratio'] = (float(stats['decoded']) / stats['wire']) if stats['wire'] else 0
+    return stats
+
+def reset_transfer_stats():
+    with _STATS_LOCK:
+        _STATS['wire'] = 0
+        _STATS['decoded'] = 0
+
+def urlopen(url, body=None, headers={}, timeout=socket._GLOBAL_DEFAULT_TIMEOUT, compress=True):
+    """request through the shared pool, direct if a proxy is set in the environment.
+    with 'compress' gzip / deflate is accepted and the body is decompressed as it is read"""
+    if compress:
+        headers = dict(headers)
+        headers.setdefault('Accept-Encoding', 'gzip, deflate')
+    parts = urlparse.urlsplit(url)
+    if (parts.scheme in urllib.getproxies()) and (not urllib.proxy_bypass(parts.hostname)):
+        req = urllib2.Request(url, body, headers)
+        try:
+            res = ProxyResponse(urllib2.urlopen(req, timeout=timeout))
+        except urllib2.HTTPError, error:
+            res = ProxyResponse(error)
+    else:
+        res = POOL.request(url, body=body, headers=headers, timeout=timeout)
+    return DecodedResponse(res)
+
+def rpc_urlopen(url, data=None, timeout=socket._GLOBAL_DEFAULT_TIMEOUT):
+    """urllib2.urlopen replacement for the KBase clients: pooled, compressed, raises urllib2.HTTPError on error status"""
+    headers = {'Content-Type': 'application/x-www-form-urlencoded'} if data is not None else {}
+    res = urlopen(url, body=data, headers=headers, timeout=timeout)
+    if res.status >= 400:
+        body = res.read()
+        res.close()
+        raise urllib2.HTTPError(res.url, res.status, res.reason, res.msg, StringIO.StringIO(body))
+    return res
+
+_DECODER = json.JSONDecoder()
+_WS = ' \t\n\r'
+
+class JSONStream(object):
+    """incremental json decode from a file-like object, only the value being decoded is buffered"""
+    def __init__(self, fhdl, chunk=CHUNK):
+        self.fhdl  = fhdl
+        self.chunk = chunk
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+
+    def _more(self, size):
+        if self.eof:
+            return False
+        data = self.fhdl.read(size)
+        if not data:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """return: next non-whitespace character, empty string at end of stream"""
+        while True:
+            while (self.pos < len(self.buf)) and (self.buf[self.pos] in _WS):
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._more(self.chunk):
+                return ''
+
+    def expect(self, chars):
+        """consume next character, it must be one of chars
+        return: the character"""
+        char = self.peek()
+        if (not char) or (char not in chars):
+            raise ValueError("JSON stream: expected one of '%s', found '%s'"%(chars, char))
+        self.pos += 1
+        return char
+
+    def value(self):
+        """return: next complete json value.
+        a value is only accepted when a character follows it (or the stream ended), so numbers are not cut at a chunk end"""
+        self.peek()
+        while True:
+            try:
+                obj, end = _DECODER.raw_decode(self.buf, self.pos)
+                if (end < len(self.buf)) or self.eof:
+                    self.pos = end
+                    return obj
+            except ValueError:
+                if self.eof:
+                    raise
+            # incomplete, grow the buffer geometrically
+            self._more(max(self.chunk, len(self.buf) - self.pos))
+
+    def array(self):
+        """return: list of the elements of the next json array, decoded one element at a time"""
+        self.expect('[')
+        items = []
+        if self.peek() == ']':
+            self.pos += 1
+            return items
+        scan = _DECODER.scan_once
+        while True:
+            # fast path: element directly followed by its separator within the buffer
+            buf = self.buf
+            try:
+                obj, end = scan(buf, self.pos)
+            except (StopIteration, ValueError):
+                end = len(buf)
+            if (end < len(buf)) and (buf[end] in ',]'):
+                items.append(obj)
+                if buf[end] == ']':
+                    self.pos = end + 1
+                    return items
+                end += 1
+                while (end < len(buf)) and (buf[end] in _WS):
+                    end += 1
+                self.pos = end
+                continue
+            items.append(self.value())
+            if self.expect(',]') == ']':
+                return items
+            self.peek()
+
+def load_json(fhdl, arrays=(), chunk=CHUNK):
+    """input: file-like object (http response), top level keys with array values to decode element by element
+    return: decoded object, same as json.load.
+    the raw text is never held whole: top level values are decoded one at a time, and the arrays one element at a time"""
+    stream = JSONStream(fhdl, chunk)
+    if stream.peek() != '{':
+        return stream.value()
+    stream.expect('{')
+    obj = {}
+    if stream.peek() == '}':
+        return obj
+    while True:
+        key = stream.value()
+        stream.expect(':')
+        if (key in arrays) and (stream.peek() == '['):
+            obj[key] = stream.array()
+        else:
+            obj[key] = stream.value()
+        if stream.expect(',}') == '}':
+            return obj
+
+_CT = 'content-type'
+_AJ = 'application/json'
+_URL_SCHEME = frozenset(['http', 'https'])
+# answers to a batch request meaning batches are not supported: http status, json-rpc error code
+_BATCH_REJECT_HTTP = frozenset([400, 404, 405, 415, 501])
+_BATCH_REJECT_RPC  = frozenset([-32600, -32601, -32700])
+
+class ServerError(Exception):
+
+    def __init__(self, name, code, message):
+        self.name = name
+        self.code = code
+        self.message = message
+
+    def __str__(self):
+        return self.name + ': ' + str(self.code) + '. ' + self.message
+
+class RPCCache(object):
+    """On-disk cache of RPC results, one file per call, named by the sha1 of service url, method name and canonical (sorted keys) params.
+    entries older than ttl seconds are refetched (ttl None is no expiry). when the files exceed max_size bytes
+    the least recently used are removed. one cache can be shared by several clients (and processes)"""
+    def __init__(self, path, ttl=CACHE_TTL, max_size=CACHE_SIZE):
+        self.path = path
+        self.ttl  = ttl
+        self.max_size = max_size
+        self.hits   = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        self._size = sum(os.path.getsize(f) for f, _ in self._files())
+
+    def key(self, url, method, params):
+        canon = json.dumps([url, method, params], sort_keys=True, separators=(',', ':'))
+        return hashlib.sha1(canon).hexdigest()
+
+    def _file(self, key):
+        return os.path.join(self.path, key[:2], key+'.json')
+
+    def _files(self):
+        """return: list of (file path, last use time)"""
+        files = []
+        for d in os.listdir(self.path):
+            sub = os.path.join(self.path, d)
+            if os.path.isdir(sub):
+                for f in os.listdir(sub):
+                    fpath = os.path.join(sub, f)
+                    try:
+                        files.append((fpath, os.path.getmtime(fpath)))
+                    except OSError:
+                        pass
+        return files
+
+    def get(self, url, method, params):
+        """return: (found, result)"""
+        fpath = self._file(self.key(url, method, params))
+        try:
+            with open(fpath) as fhdl:
+                entry = json.load(fhdl)
+        except (IOError, ValueError):
+            entry = None
+        if (entry is not None) and (entry.get('url') == url) and (entry.get('method') == method) and ((self.ttl is None) or (time.time() - entry['time'] < self.ttl)):
+            try:
+                # mtime is the last use, for LRU eviction
+                os.utime(fpath, None)
+            except OSError:
+                pass
+            with self._lock:
+                self.hits += 1
+            return True, entry['result']
+        with self._lock:
+            self.misses += 1
+        return False, None
+
+    def put(self, url, method, params, result):
+        fpath = self._file(self.key(url, method, params))
+        fdir  = os.path.dirname(fpath)
+        if not os.path.isdir(fdir):
+            try:
+                os.makedirs(fdir)
+            except OSError:
+                pass
+        data = json.dumps({'url': url, 'method': method, 'time': time.time(), 'result': result}, separators=(',', ':'))
+        # written to a temp file and renamed, readers never see part of an entry
+        fd, tmp = tempfile.mkstemp(dir=fdir, suffix='.tmp')
+        with os.fdopen(fd, 'w') as fhdl:
+            fhdl.write(data)
+        old = os.path.getsize(fpath) if os.path.isfile(fpath) else 0
+        os.rename(tmp, fpath)
+        with self._lock:
+            self._size += len(data) - old
+            full = self.max_size and (self._size > self.max_size)
+        if full:
+            self._evict()
+
+    def _evict(self):
+        """remove least recently used files until the cache is below 90% of max_size"""
+        with self._lock:
+            files = sorted(self._files(), key=lambda x: x[1])
+            sizes = []
+            for fpath, _ in files:
+                try:
+                    sizes.append(os.path.getsize(fpath))
+                except OSError:
+                    sizes.append(0)
+            self._size = sum(sizes)
+            for (fpath, _), size in zip(files, sizes):
+                if self._size <= self.max_size * 0.9:
+                    break
+                try:
+                    os.remove(fpath)
+                    self._size -= size
+                    self.evictions += 1
+                except OSError:
+                    pass
+
+    def clear(self):
+        with self._lock:
+            for fpath, _ in self._files():
+                try:
+                    os.remove(fpath)
+                except OSError:
+                    pass
+            self._size = 0
+
+    def stats(self):
+        """return: hash of hits, misses, hit ratio, evictions and bytes used"""
+        with self._lock:
+            calls = self.hits + self.misses
+            return { 'hits': self.hits,
+                     'misses': self.misses,
+                     'ratio': (float(self.hits) / calls) if calls else 0,
+                     'evictions': self.evictions,
+                     'size': self._size }
+
+class _RPCMethods(type):
+    """metaclass of JSONRPCClient, class level access of table methods generates them"""
+    def __getattr__(cls, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return cls._rpc_method(name)
+
+    def __dir__(cls):
+        names = set(cls._rpc_table().keys())
+        for c in cls.__mro__:
+            names.update(c.__dict__.keys())
+        return sorted(names)
+
+class JSONRPCClient(object):
+    """Base of the KBase JSON-RPC service clients.
+    subclasses set _service (service name) and _methods (method table, one 'method_name arg1, arg2' per line).
+    a table method is generated on first use, with its argument names, and calls _call().
+    calls whose first argument is in _chunk_args and is a list longer than chunk_size are split into chunks,
+    sent by up to chunk_workers threads (each retried chunk_retries times on connection errors) and merged.
+    set chunk_size to None to disable. with enable_cache() results are kept in an on-disk RPCCache"""
+    __metaclass__ = _RPCMethods
+    _service = None
+    _methods = ''
+    _chunk_args = frozenset()
+    chunk_size    = 5000
+    chunk_workers = 4
+    chunk_retries = 2
+    cache = None
+
+    def __init__(self, url, timeout = 30 * 60):
+        if url is None:
+            raise ValueError('A url is required')
+        scheme, _, _, _, _, _ = urlparse.urlparse(url)
+        if scheme not in _URL_SCHEME:
+            raise ValueError(url + " isn't a valid http url")
+        self.url = url
+        self.timeout = int(timeout)
+        if self.timeout < 1:
+            raise ValueError('Timeout value must be at least 1 second')
+
+    @classmethod
+    def _rpc_table(cls):
+        """return: hash of method name -> argument string"""
+        if '_table' not in cls.__dict__:
+            table = {}
+            for line in cls._methods.strip().splitlines():
+                name, _, args = line.strip().partition(' ')
+                table[name] = args.strip()
+            cls._table = table
+        return cls._table
+
+    @classmethod
+    def _rpc_method(cls, name):
+        """generate table method 'name' on the class
+        return: the unbound method"""
+        table = cls._rpc_table()
+        if name not in table:
+            raise AttributeError("type object '%s' has no attribute '%s'"%(cls.__name__, name))
+        args = table[name]
+        src  = "def %s(self%s):\n    return self._call('%s.%s', [%s])\n"%(name, ', '+args if args else '', cls._service, name, args)
+        code = {}
+        exec src in code
+        setattr(cls, name, code[name])
+        return cls.__dict__[name].__get__(None, cls)
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        try:
+            return type(self)._rpc_method(name).__get__(self, type(self))
+        except AttributeError:
+            raise AttributeError("'%s' object has no attribute '%s'"%(type(self).__name__, name))
+
+    def __dir__(self):
+        return sorted(set(dir(type(self)) + self.__dict__.keys()))
+
+    def enable_cache(self, cache, ttl=CACHE_TTL, max_size=CACHE_SIZE):
+        """input: RPCCache or directory path of one
+        return: the RPCCache, results of this client are cached in it"""
+        if isinstance(cache, basestring):
+            cache = RPCCache(cache, ttl=ttl, max_size=max_size)
+        self.cache = cache
+        return cache
+
+    def disable_cache(self):
+        self.cache = None
+
+    def async_client(self):
+        """return: AsyncClient, table methods called on it return an RPCFuture and run concurrently"""
+        return AsyncClient(self)
+
+    def batch(self):
+        """return: RPCBatch, table methods called on it are queued and return an RPCFuture.
+        the queue is sent as one JSON-RPC batch request when the 'with' block ends (or on send())"""
+        return RPCBatch(self)
+
+    def _call(self, method, params):
+        """send JSON-RPC request, chunked if the id list is too long
+        return: first result"""
+        if self._needs_chunks(method, params):
+            return self._call_chunked(method, params)
+        return self._call_one(method, params)
+
+    def _needs_chunks(self, method, params):
+        return self.chunk_size and params and isinstance(params[0], list) and (len(params[0]) > self.chunk_size) and self._chunked(method)
+
+    def _batchable(self, method, params):
+        """return: true if the call is sent as one plain request (not chunked, not answered locally), so it can be part of a batch"""
+        return not self._needs_chunks(method, params)
+
+    def _chunked(self, method):
+        args = self._rpc_table().get(method.split('.')[-1])
+        return bool(args) and (args.split(',')[0].strip() in self._chunk_args)
+
+    def _call_chunked(self, method, params):
+        """first param is split, results (hash or list) are merged as chunks complete"""
+        ids = params[0]
+        chunks = [ ids[i:i+self.chunk_size] for i in range(0, len(ids), self.chunk_size) ]
+        def run(i):
+            for attempt in range(self.chunk_retries + 1):
+                try:
+                    return i, self._call_one(method, [chunks[i]] + params[1:])
+                except (URLError, socket.error, httplib.HTTPException), e:
+                    # HTTPError is a service answer, not retried
+                    if isinstance(e, HTTPError) or (attempt == self.chunk_retries):
+                        raise
+        merged = None
+        parts  = {}
+        pool = ThreadPool(max(1, min(self.chunk_workers, len(chunks))))
+        try:
+            for i, result in pool.imap_unordered(run, range(len(chunks))):
+                if isinstance(result, dict):
+                    if merged is None:
+                        merged = {}
+                    merged.update(result)
+                else:
+                    parts[i] = result
+        finally:
+            pool.terminate()
+        if parts:
+            # lists are joined in chunk order
+            if merged is not None:
+                raise ServerError('Unknown', 0, 'Chunked results of %s are not of one type'%method)
+            merged = []
+            for i in sorted(parts):
+                merged.extend(parts[i] or [])
+        return merged
+
+    def _call_one(self, method, params):
+        """send one JSON-RPC request, answered from the cache if enabled
+        return: first result"""
+        if self.cache is not None:
+            found, result = self.cache.get(self.url, method, params)
+            if found:
+                return result
+        resp = self._post({ 'method': method, 'params': params, 'version': '1.1' })
+        if 'result' in resp:
+            if self.cache is not None:
+                self.cache.put(self.url, method, params, resp['result'][0])
+            return resp['result'][0]
+        else:
+            raise ServerError('Unknown', 0, 'An unknown server error occurred')
+
+    def _post(self, request):
+        """input: JSON-RPC request object (or list of them)
+        return: decoded response"""
+        body = json.dumps(request)
+        try:
+            ret = rpc_urlopen(self.url, body, timeout = self.timeout)
+        except HTTPError as h:
+            if _CT in h.headers and h.headers[_CT] == _AJ:
+                err = json.loads(h.read())
+                if isinstance(err, list):
+                    # batch reply with failed calls, errors are per call
+                    return err
+                if 'error' in err:
+                    raise ServerError(**err['error'])
+                else:
+                    raise h
+            else:
+                raise h
+        if ret.code != httplib.OK:
+            raise URLError('Received bad response code from server:' + str(ret.code))
+        return json.loads(ret.read())
+
+class RPCFuture(object):
+    """result of a queued call, result() sends the queue if it was not yet sent"""
+    def __init__(self, batch=None):
+        self._batch = batch
+        self._done  = threading.Event()
+        self._result = None
+        self._error  = None
+
+    def done(self):
+        return self._done.is_set()
+
+    def set_result(self, result):
+        self._result = result
+        self._done.set()
+
+    def set_exception(self, error):
+        self._error = error
+        self._done.set()
+
+    def exception(self, timeout=None):
+        self._wait(timeout)
+        return self._error
+
+    def result(self, timeout=None):
+        self._wait(timeout)
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def _wait(self, timeout):
+        if (not self.done()) and self._batch and (not self._batch.sent):
+            self._batch.send()
+        if not self._done.wait(timeout):
+            raise RuntimeError("RPC call not done within %s seconds"%timeout)
+
+class RPCBatch(object):
+    """queue of calls of one client, sent as a single JSON-RPC batch (array) request.
+    calls the client would chunk or answer locally (mirror) go through the client first, cached results are used,
+    only the remaining plain calls are batched and their results are cached.
+    if the service does not accept batches the calls are sent one by one, and the client does not batch again"""
+    def __init__(self, client):
+        self.client = client
+        self.sent   = False
+        self._queue = []
+        self._lock  = threading.Lock()
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        if name not in type(self.client)._rpc_table():
+            raise AttributeError("'RPCBatch' object has no attribute '%s'"%name)
+        # table method run with this batch as self, so its _call() queues
+        func = getattr(type(self.client), name).im_func
+        return func.__get__(self, RPCBatch)
+
+    def _call(self, method, params):
+        future = RPCFuture(self)
+        with self._lock:
+            if self.sent:
+                raise RuntimeError("RPC batch already sent")
+            self._queue.append((method, params, future))
+        return future
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, etype, value, tb):
+        if etype is None:
+            self.send()
+
+    def send(self):
+        """send the queued calls, results are set on their futures"""
+        with self._lock:
+            if self.sent:
+                return
+            self.sent = True
+            queue, self._queue = self._queue, []
+        client = self.client
+        plain  = []
+        for method, params, future in queue:
+            if not client._batchable(method, params):
+                self._run(method, params, future)
+                continue
+            if client.cache is not None:
+                found, result = client.cache.get(client.url, method, params)
+                if found:
+                    future.set_result(result)
+                    continue
+            plain.append((method, params, future))
+        queue = plain
+        if not queue:
+            return
+        if (len(queue) > 1) and getattr(self.client, '_batch_ok', True):
+            request = map(lambda (i, q): { 'method': q[0], 'params': q[1], 'version': '1.1', 'id': str(i) }, enumerate(queue))
+            try:
+                resp = self.client._post(request)
+            except Exception, e:
+                if not self._unsupported(e):
+                    for method, params, future in queue:
+                        future.set_exception(e)
+                    raise
+                resp = None
+            if isinstance(resp, list):
+                byid = dict(map(lambda x: (str(x.get('id')), x), filter(lambda x: isinstance(x, dict), resp)))
+                for i, (method, params, future) in enumerate(queue):
+                    resp = byid.get(str(i))
+                    self._set(future, resp)
+                    if (client.cache is not None) and resp and (resp.get('result') is not None):
+                        client.cache.put(client.url, method, params, resp['result'][0])
+                return
+            # batch not accepted
+            self.client._batch_ok = False
+        for method, params, future in queue:
+            self._run(method, params, future)
+
+    def _run(self, method, params, future):
+        """call through the client, result or error is set on future"""
+        try:
+            future.set_result(self.client._call(method, params))
+        except Exception, e:
+            future.set_exception(e)
+
+    def _unsupported(self, error):
+        """error of a batch request that shows the service does not take batches"""
+        if isinstance(error, ValueError):
+            return True
+        if isinstance(error, HTTPError):
+            return error.code in _BATCH_REJECT_HTTP
+        if isinstance(error, ServerError):
+            return error.code in _BATCH_REJECT_RPC
+        return False
+
+    def _set(self, future, resp):
+        if resp and ('result' in resp) and (resp['result'] is not None):
+            future.set_result(resp['result'][0])
+        elif resp and resp.get('error'):
+            try:
+                future.set_exception(ServerError(**resp['error']))
+            except TypeError:
+                future.set_exception(ServerError('Unknown', 0, str(resp['error'])))
+        else:
+            future.set_exception(ServerError('Unknown', 0, 'An unknown server error occurred'))
+
+_ASYNC = {'pool': None, 'size': 0}
+_ASYNC_LOCK = threading.Lock()
+
+def async_pool():
+    """return: thread pool shared by all AsyncClients, of ASYNC_LIMIT threads"""
+    with _ASYNC_LOCK:
+        if (_ASYNC['pool'] is None) or (_ASYNC['size'] != ASYNC_LIMIT):
+            if _ASYNC['pool'] is not None:
+                # running calls finish on the old pool
+                _ASYNC['pool'].close()
+            _ASYNC['pool'] = ThreadPool(ASYNC_LIMIT)
+            _ASYNC['size'] = ASYNC_LIMIT
+        return _ASYNC['pool']
+
+def gather(futures, timeout=None):
+    """input: list of RPCFutures
+    return: list of their results, in order. the first error is raised"""
+    return map(lambda f: f.result(timeout), futures)
+
+class AsyncClient(object):
+    """non-blocking view of a client, table methods return an RPCFuture at once.
+    calls run on the shared async_pool() (at most ASYNC_LIMIT at a time) and the shared connection pool.
+    don't wait on a future inside a call of the same pool.
+    eg. gather([ anet.entity2Datasets(g) for g in genes ])"""
+    def __init__(self, client):
+        self.client = client
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        if name not in type(self.client)._rpc_table():
+            raise AttributeError("'AsyncClient' object has no attribute '%s'"%name)
+        # table method run with this view as self, so its _call() submits
+        func = getattr(type(self.client), name).im_func
+        return func.__get__(self, AsyncClient)
+
+    def __dir__(self):
+        return sorted(set(type(self.client)._rpc_table().keys() + self.__dict__.keys() + ['map']))
+
+    def _call(self, method, params):
+        future = RPCFuture()
+        def run():
+            try:
+                future.set_result(self.client._call(method, params))
+            except Exception, e:
+                future.set_exception(e)
+        async_pool().apply_async(run)
+        return future
+
+    def map(self, name, args_list):
+        """input: table method name, list of argument tuples (or single arguments)
+        return: list of RPCFutures, one per call"""
+        method = getattr(self, name)
+        return [ method(*(args if isinstance(args, tuple) else (args,))) for args in args_list ]